@@ -3,6 +3,8 @@ Camera package for handling different camera sources.
 Supports both ESP32-CAM and regular webcams.
 """
 from .esp32_stream import ESP32CamStream
-from .camera_manager import initialize_camera
+from .camera_manager import initialize_camera, configure_webcam, request_grayscale
+from .capture_thread import CaptureThread
 
-__all__ = ['ESP32CamStream', 'initialize_camera']
+__all__ = ['ESP32CamStream', 'initialize_camera', 'configure_webcam', 'request_grayscale',
+           'CaptureThread']
@@ -7,11 +7,63 @@ from .esp32_stream import ESP32CamStream
 from .. import config
 
 
-def initialize_camera():
+def configure_webcam(cap):
+    """
+    Apply low-latency capture settings to an opened webcam.
+
+    Keeps the driver buffer to a single frame so each read() returns the
+    freshest image instead of one queued seconds ago, and requests a
+    compressed format to reduce USB bandwidth and decode time.
+    Backends that don't support a property simply ignore it.
+
+    Args:
+        cap (cv2.VideoCapture): Opened webcam
+
+    Returns:
+        cv2.VideoCapture: The same capture object
+    """
+    if config.CAMERA_FOURCC:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*config.CAMERA_FOURCC))
+    if config.CAMERA_FPS:
+        cap.set(cv2.CAP_PROP_FPS, config.CAMERA_FPS)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, config.CAMERA_BUFFER_SIZE)
+    return cap
+
+
+def request_grayscale(cap):
+    """
+    Ask the webcam driver to deliver 8-bit grayscale frames directly.
+
+    Haar detection only needs the luma plane, so when the driver supports the
+    GREY format we skip the BGR->GRAY conversion on every frame. Frames come
+    back unconverted, possibly as one flat row of bytes.
+
+    Args:
+        cap (cv2.VideoCapture): Opened webcam
+
+    Returns:
+        bool: True if the driver accepted the grayscale format
+    """
+    grey = cv2.VideoWriter_fourcc(*'GREY')
+    cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+    if cap.set(cv2.CAP_PROP_FOURCC, grey) and int(cap.get(cv2.CAP_PROP_FOURCC)) == grey:
+        return True
+
+    # Not supported - go back to normal BGR frames
+    cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+    return False
+
+
+def initialize_camera(rgb=False):
     """
     Initialize camera based on configuration.
     Tries ESP32-CAM first (if configured), then falls back to webcam.
 
+    Args:
+        rgb (bool): Let the ESP32-CAM stream decode straight to RGB when it
+                    can do so for free (see ESP32CamStream). Webcams always
+                    deliver BGR.
+
     Returns:
         camera object: Either ESP32CamStream or cv2.VideoCapture object
         None: If no camera could be initialized
@@ -26,7 +78,7 @@ def initialize_camera():
     if config.USE_ESP32:
         print(f"📷 Modo: ESP32-CAM")
         print(f"🌐 URL: {config.ESP32_URL}")
-        cap = ESP32CamStream(config.ESP32_URL)
+        cap = ESP32CamStream(config.ESP32_URL, rgb=rgb)
 
         if not cap.connect():
             print("\n⚠️  Falha ao conectar ao ESP32-CAM")
@@ -42,6 +94,7 @@ def initialize_camera():
                 print("4. Webcam está disponível?")
                 exit(1)
             else:
+                configure_webcam(cap)
                 print("✅ Webcam conectada com sucesso!")
         else:
             print("✅ ESP32-CAM conectado!")
@@ -54,6 +107,7 @@ def initialize_camera():
             print("Verifique se a webcam está disponível")
             exit(1)
         else:
+            configure_webcam(cap)
             print("✅ Webcam conectada com sucesso!")
 
     print("\nHand Detection Started!")
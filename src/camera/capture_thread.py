@@ -0,0 +1,107 @@
+"""
+Capture Thread Module.
+Reads frames from a camera on a background thread so that waiting for the
+next frame overlaps with detection on the current one.
+"""
+import queue
+import threading
+
+
+def put_latest(slot, item):
+    """
+    Put an item in a size-1 queue, replacing the waiting item if there is one.
+
+    The producer never blocks, and the consumer always gets the newest item:
+    if the consumer falls behind, older items are dropped instead of piling up.
+
+    Args:
+        slot (queue.Queue): Queue created with maxsize=1
+        item: Item to put
+    """
+    while True:
+        try:
+            slot.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                slot.get_nowait()
+            except queue.Empty:
+                pass
+
+
+class CaptureThread:
+    """
+    Background frame reader for any camera with a cv2.VideoCapture-like interface.
+
+    Works with both cv2.VideoCapture and ESP32CamStream. The reader thread keeps
+    calling cap.read() and keeps only the newest frame for the main loop, so
+    the main loop never waits on camera I/O and never processes stale frames.
+    Provides the same read()/isOpened()/release() interface as cv2.VideoCapture.
+    """
+
+    def __init__(self, cap):
+        """
+        Initialize the capture thread (call start() to begin reading).
+
+        Args:
+            cap: Opened camera object (cv2.VideoCapture or ESP32CamStream)
+        """
+        self.cap = cap
+        self.frames = queue.Queue(maxsize=1)
+        self.stopped = threading.Event()
+        self.finished = False  # True once the end-of-stream sentinel was read
+        self.thread = threading.Thread(target=self._reader_loop, daemon=True)
+
+    def start(self):
+        """
+        Start the background reader thread.
+
+        Returns:
+            CaptureThread: self, so it can be chained after the constructor
+        """
+        self.thread.start()
+        return self
+
+    def _reader_loop(self):
+        """Read frames until the camera fails or release() is called."""
+        while not self.stopped.is_set():
+            success, frame = self.cap.read()
+            if not success:
+                break
+
+            # Replace any frame the main loop hasn't picked up yet
+            put_latest(self.frames, frame)
+
+        # None tells the consumer that no more frames will arrive
+        put_latest(self.frames, None)
+
+    def read(self):
+        """
+        Get the next frame read by the background thread.
+
+        Returns:
+            tuple: (success, frame) - same format as cv2.VideoCapture
+        """
+        if self.finished:
+            return False, None
+
+        frame = self.frames.get()
+        if frame is None:
+            self.finished = True
+            return False, None
+        return True, frame
+
+    def isOpened(self):
+        """
+        Check if the underlying camera is opened.
+
+        Returns:
+            bool: True if frames can still be read, False otherwise
+        """
+        return not self.finished and self.cap.isOpened()
+
+    def release(self):
+        """Stop the reader thread and release the underlying camera."""
+        self.stopped.set()
+        self.thread.join(timeout=2)
+        self.cap.release()
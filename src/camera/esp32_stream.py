@@ -3,28 +3,80 @@ ESP32-CAM Stream Handler Module.
 Provides a class to capture MJPEG stream from ESP32-CAM.
 Works better than cv2.VideoCapture() for ESP32-CAM.
 """
+import http.client
+import re
+import socket
+import threading
+import urllib.parse
 import cv2
-import requests
 import numpy as np
+from .. import config
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJPF_RGB
+except ImportError:
+    # PyTurboJPEG is optional - without it frames are decoded with cv2.imdecode
+    TurboJPEG = None
+
+# Multipart framing used by the ESP32-CAM stream
+BOUNDARY = b'\r\n--frame\r\n'
+HEADER_END = b'\r\n\r\n'
+CONTENT_LENGTH = re.compile(rb'Content-Length:\s*(\d+)', re.IGNORECASE)
 
 
 class ESP32CamStream:
     """
     Class to capture MJPEG stream from ESP32-CAM.
     Provides a similar interface to cv2.VideoCapture for compatibility.
+
+    The stream is received straight into one preallocated buffer with
+    readinto, so no intermediate bytes objects are created per chunk.
+    When a part announces its Content-Length, the JPEG is read by size
+    instead of searching it for the next boundary.
+    A background thread receives JPEGs and keeps only the newest one, while
+    read() decodes it on the caller's thread, so network I/O and decoding
+    overlap instead of adding up.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, rgb=False):
         """
         Initialize ESP32-CAM stream.
 
         Args:
             url (str): ESP32-CAM stream URL
+            rgb (bool): Deliver RGB frames when the JPEG decoder can produce
+                        them for free (libjpeg-turbo). Check the rgb attribute
+                        for the channel order actually delivered.
         """
         self.url = url
+        self.connection = None
+        self.sock = None
         self.stream = None
-        self.bytes_buffer = b''
-        self.stream_iterator = None
+        self.chunk_size = config.ESP32_CHUNK_SIZE
+        self._buf = bytearray(4 * self.chunk_size)  # Receive buffer, grown when full
+        self._len = 0  # Bytes of _buf holding stream data
+        self._scan_pos = 0  # Buffer offset already searched for the boundary
+
+        # Newest JPEG received by the reader thread, not yet decoded. Each one
+        # gets its own uint8 array, handed to the decoder as is
+        self._latest_jpg = None
+        self._ended = False  # True once the reader thread has stopped
+        self._new_frame = threading.Condition()
+        self.stopped = threading.Event()
+        self.thread = None
+
+        # libjpeg-turbo decoder, writes BGR directly with its SIMD code paths
+        self._tj = None
+        if TurboJPEG is not None:
+            try:
+                self._tj = TurboJPEG()
+            except (OSError, RuntimeError):
+                # The libturbojpeg shared library isn't installed
+                pass
+
+        # Only decode to RGB when it costs nothing - converting afterwards
+        # would be no cheaper than converting in the caller
+        self.rgb = rgb and self._tj is not None
 
     def connect(self):
         """
@@ -35,21 +87,97 @@ class ESP32CamStream:
         """
         try:
             print(f"Tentando conectar a {self.url}...")
-            self.stream = requests.get(self.url, stream=True, timeout=10)
-            # Create the iterator once
-            self.stream_iterator = self.stream.iter_content(chunk_size=1024)
+            url = urllib.parse.urlsplit(self.url)
+            path = url.path or '/'
+            if url.query:
+                path += '?' + url.query
+
+            self.connection = http.client.HTTPConnection(url.hostname, url.port, timeout=10)
+            self.connection.request('GET', path)
+            # Keep the socket: the connection forgets it once the response
+            # turns out to be a stream that ends when the socket closes
+            self.sock = self.connection.sock
+            self.stream = self.connection.getresponse()
+            if self.stream.status != 200:
+                raise ConnectionError(f"HTTP {self.stream.status} {self.stream.reason}")
+
+            # Receive frames in the background from now on
+            self.thread = threading.Thread(target=self._reader_loop, daemon=True)
+            self.thread.start()
+
             print(f"✅ Conectado com sucesso!")
             return True
         except Exception as e:
             print(f"❌ Erro ao conectar: {e}")
+            self.release()
             return False
 
     def read(self):
         """
-        Read a frame from the MJPEG stream.
+        Read the newest frame from the MJPEG stream.
+
+        Waits for a JPEG that hasn't been read yet, then decodes it. Frames
+        received while the caller was busy are skipped.
 
         Returns:
             tuple: (success, frame) - same format as cv2.VideoCapture
+        """
+        if self.stream is None:
+            return False, None
+
+        while True:
+            with self._new_frame:
+                self._new_frame.wait_for(lambda: self._latest_jpg is not None or self._ended)
+                jpg_data, self._latest_jpg = self._latest_jpg, None
+
+            if jpg_data is None:
+                return False, None
+
+            # Decode JPEG to OpenCV image (skipping corrupt frames)
+            frame = self._decode(jpg_data)
+            if frame is not None:
+                return True, frame
+
+    def _decode(self, jpg_data):
+        """
+        Decode a JPEG to a BGR (or RGB) frame, with libjpeg-turbo when available.
+
+        Args:
+            jpg_data (numpy.ndarray): JPEG data (uint8)
+
+        Returns:
+            numpy.ndarray: BGR frame (RGB if self.rgb), or None if the data is corrupt
+        """
+        if self._tj is not None:
+            try:
+                return self._tj.decode(jpg_data,
+                                       pixel_format=TJPF_RGB if self.rgb else TJPF_BGR)
+            except OSError:
+                return None
+        return cv2.imdecode(jpg_data, cv2.IMREAD_COLOR)
+
+    def _reader_loop(self):
+        """Receive JPEGs until the stream ends, keeping only the newest one."""
+        while not self.stopped.is_set():
+            jpg_data = self._read_jpeg()
+            if jpg_data is None:
+                break
+
+            # Replace any JPEG that read() hasn't picked up yet
+            with self._new_frame:
+                self._latest_jpg = jpg_data
+                self._new_frame.notify()
+
+        with self._new_frame:
+            self._ended = True
+            self._new_frame.notify()
+
+    def _read_jpeg(self):
+        """
+        Receive the next JPEG from the MJPEG stream.
+
+        Returns:
+            numpy.ndarray: JPEG data (uint8), or None when the stream has ended
 
         Works with ESP32-CAM format:
         Content-Type: image/jpeg
@@ -58,63 +186,167 @@ class ESP32CamStream:
         <JPEG data>
         --frame
         """
-        if self.stream_iterator is None:
-            return False, None
-
         try:
-            # Read chunks until we have a complete frame
+            # Read chunks until we have a complete frame. A large chunk may
+            # hold several frames, so the buffer is checked before reading more.
             while True:
-                # Get next chunk from iterator
-                try:
-                    chunk = next(self.stream_iterator)
-                except StopIteration:
-                    return False, None
-
-                if not chunk:
+                # Each part starts with its headers (the boundary of the
+                # previous part, if any, comes before them and is ignored)
+                header_end = self._buf.find(HEADER_END, 0, self._len)
+                if header_end == -1:
+                    if not self._receive_more():
+                        return None
                     continue
+                start = header_end + len(HEADER_END)
 
-                self.bytes_buffer += chunk
+                # ESP32-CAM sends the JPEG size, so the JPEG itself never has
+                # to be searched for the boundary
+                match = CONTENT_LENGTH.search(self._buf, 0, header_end)
+                if match:
+                    length = int(match.group(1))
+                    if length == 0:
+                        self._consume(start)
+                        continue
+                    return self._read_payload(start, length)
 
-                # Look for ESP32-CAM boundary
+                # No Content-Length: the JPEG ends at the next boundary
                 # ESP32 uses "\r\n--frame\r\n" as separator
-                boundary = b'\r\n--frame\r\n'
-                boundary_pos = self.bytes_buffer.find(boundary)
-
-                if boundary_pos != -1:
-                    # Get everything before boundary (complete frame)
-                    frame_data = self.bytes_buffer[:boundary_pos]
+                boundary_pos = self._buf.find(BOUNDARY, max(self._scan_pos, start), self._len)
 
-                    # Look for header "Content-Type: image/jpeg"
-                    header_end = frame_data.find(b'\r\n\r\n')
-                    if header_end != -1:
-                        # Skip header and get only JPEG data
-                        jpg_data = frame_data[header_end + 4:]
+                if boundary_pos == -1:
+                    # Next time, only search the new bytes (plus enough of the
+                    # old ones to catch a boundary split across two chunks)
+                    self._scan_pos = max(start, self._len - len(BOUNDARY) + 1)
+                    if not self._receive_more():
+                        return None
+                else:
+                    # Everything between the headers and the boundary is the JPEG
+                    jpg_data = None
+                    if boundary_pos > start:
+                        # Copy out only the JPEG data, straight into an
+                        # uninitialized array the decoder takes without another
+                        # copy or wrapper (the buffer is reused for the next
+                        # frame while this one is decoded, so it can't be
+                        # handed over as a view)
+                        jpg_data = np.empty(boundary_pos - start, dtype=np.uint8)
+                        with memoryview(self._buf) as view:
+                            jpg_data.data[:] = view[start:boundary_pos]
 
-                        # Remove processed frame from buffer
-                        self.bytes_buffer = self.bytes_buffer[boundary_pos + len(boundary):]
+                    # Remove processed frame from buffer
+                    self._consume(boundary_pos + len(BOUNDARY))
+                    self._scan_pos = 0
 
-                        # Decode JPEG to OpenCV image
-                        if len(jpg_data) > 0:
-                            frame = cv2.imdecode(
-                                np.frombuffer(jpg_data, dtype=np.uint8),
-                                cv2.IMREAD_COLOR
-                            )
-
-                            if frame is not None:
-                                return True, frame
+                    if jpg_data is not None:
+                        return jpg_data
 
         except Exception as e:
+            if self.stopped.is_set():
+                # The connection was closed by release()
+                return None
             print(f"❌ Erro ao ler frame: {e}")
             import traceback
             traceback.print_exc()
-            return False, None
+            return None
+
+    def _read_payload(self, start, length):
+        """
+        Read a JPEG of known size that starts at the given buffer offset.
+
+        The part already in the buffer is copied out and the rest is received
+        straight into the JPEG array, bypassing the buffer.
+
+        Args:
+            start (int): Buffer offset of the first JPEG byte
+            length (int): JPEG size in bytes (from Content-Length)
+
+        Returns:
+            numpy.ndarray: JPEG data (uint8), or None when the stream has ended
+        """
+        jpg_data = np.empty(length, dtype=np.uint8)
+        buffered = min(self._len - start, length)
+        with memoryview(self._buf) as view:
+            jpg_data.data[:buffered] = view[start:start + buffered]
+        self._consume(start + buffered)
+        self._scan_pos = 0
+
+        if buffered < length:
+            # Blocks until the whole rest has arrived (or the stream ends)
+            missing = length - buffered
+            if self.stream.readinto(jpg_data.data[buffered:]) < missing:
+                return None
+        return jpg_data
+
+    def _receive_more(self):
+        """
+        Receive the next chunk directly after the buffered data.
+
+        Returns:
+            bool: False when the stream has ended
+        """
+        received = self._receive()
+        self._len += received
+        return received > 0
+
+    def _receive(self):
+        """
+        Receive up to chunk_size bytes into the buffer after the stored data.
+
+        Returns:
+            int: Number of bytes received (0 when the stream has ended)
+        """
+        # Make room for a full chunk
+        if len(self._buf) - self._len < self.chunk_size:
+            self._buf.extend(bytes(max(len(self._buf), self.chunk_size)))
+
+        with memoryview(self._buf) as view:
+            target = view[self._len:self._len + self.chunk_size]
+            if self.stream.chunked:
+                # Chunked transfer encoding has to be unwrapped by http.client
+                data = self.stream.read1(self.chunk_size)
+                target[:len(data)] = data
+                received = len(data)
+            else:
+                # Reads bytes already buffered while parsing the headers first,
+                # then at most one recv_into straight into our buffer
+                received = self.stream.fp.readinto1(target)
+            target.release()
+        return received
+
+    def _consume(self, count):
+        """
+        Drop the first count bytes of the buffer, keeping the rest.
+
+        Args:
+            count (int): Number of bytes to drop
+        """
+        remaining = self._len - count
+        if remaining > 0:
+            # Same-size slice assignment moves the bytes without reallocating
+            with memoryview(self._buf) as view:
+                view[:remaining] = view[count:self._len]
+        self._len = remaining
 
     def release(self):
-        """Close the connection to the stream."""
+        """Stop the reader thread and close the connection to the stream."""
+        self.stopped.set()
+        if self.sock is not None:
+            # Wake up the reader thread if it is blocked waiting for data
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.sock = None
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+            self.thread = None
+
         if self.stream:
             self.stream.close()
             self.stream = None
             print("Conexão fechada")
+        if self.connection:
+            self.connection.close()
+            self.connection = None
 
     def isOpened(self):
         """
@@ -123,4 +355,4 @@ class ESP32CamStream:
         Returns:
             bool: True if stream is connected, False otherwise
         """
-        return self.stream is not None and self.stream_iterator is not None
+        return self.stream is not None
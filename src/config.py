@@ -11,20 +11,49 @@ load_dotenv()
 # Camera Configuration
 USE_ESP32 = os.getenv('USE_ESP32', 'True').lower() in ('true', '1', 'yes')
 ESP32_URL = os.getenv('ESP32_URL', 'YOUR_URL')
+ESP32_CHUNK_SIZE = int(os.getenv('ESP32_CHUNK_SIZE', '16384'))  # Bytes per stream read (~one JPEG frame)
+
+# Webcam Capture Configuration
+CAMERA_BUFFER_SIZE = 1  # Frames buffered by the driver (1 = always the freshest frame)
+CAMERA_FPS = 30         # Requested capture frame rate
+CAMERA_FOURCC = 'MJPG'  # Compressed format uses less USB bandwidth (None = driver default)
 
 # Hand Detection Configuration
-MAX_NUM_HANDS = 2
+MAX_NUM_HANDS = 1            # One hand is enough for gesture control (halves per-hand work)
+COMBINED_MAX_NUM_HANDS = 2   # combined_detection.py still tracks both hands
+HAND_MODEL_COMPLEXITY = 0    # 0 = lite model (faster), 1 = full model (more accurate)
+HAND_DETECT_WIDTH = 320      # Frames are shrunk to this width before hand detection (None = full size)
+HAND_DETECT_EVERY_N = 2      # Run MediaPipe every N frames while a hand is found, reuse landmarks in between
 MIN_DETECTION_CONFIDENCE = 0.5
 MIN_TRACKING_CONFIDENCE = 0.5
+HAND_DETECTOR = os.getenv('HAND_DETECTOR', 'solutions')  # 'solutions' or 'live_stream' (async, needs the model below)
+HAND_LANDMARKER_MODEL = 'hand_landmarker.task'
 
 # Display Configuration
 WINDOW_NAME = 'Hand Detection'
+HEADLESS = os.getenv('HEADLESS', 'False').lower() in ('true', '1', 'yes')  # No window, keys from terminal
 MIRROR_CAMERA = True  # Flip camera horizontally for mirror effect
+ASYNC_DETECTION = os.getenv('ASYNC_DETECTION', 'False').lower() in ('true', '1', 'yes')  # Detect on a separate thread, show every frame
 
 # Person Detection Configuration (Full Body)
 PERSON_SCALE_FACTOR = 1.1  # Image pyramid scale (lower = more accurate but slower)
 PERSON_MIN_NEIGHBORS = 3   # Detection strictness (lower for full body detection)
 PERSON_MIN_SIZE = (60, 120) # Minimum person size in pixels (width, height) - taller for body
+PERSON_MAX_SIZE = None      # Maximum person size in pixels (width, height); smaller = fewer scales to scan (None = no limit)
+PERSON_DETECT_WIDTH = 320  # Frames are shrunk to this width before detection (None = full size)
+PERSON_DETECT_EVERY_N = 5  # Run the detector every N frames, track boxes in between
+USE_OPENCL = True          # Run Haar detection on the GPU through OpenCL when available
+PERSON_GRAY_CAPTURE = False  # Ask the webcam for grayscale frames (skips color conversion)
+
+# DNN Person Detection Configuration (MobileNet-SSD, used when PERSON_DETECTOR = 'dnn')
+PERSON_DETECTOR = os.getenv('PERSON_DETECTOR', 'haar')  # 'haar' or 'dnn'
+PERSON_DNN_PROTOTXT = 'MobileNetSSD_deploy.prototxt'
+PERSON_DNN_MODEL = 'MobileNetSSD_deploy.caffemodel'
+PERSON_DNN_CONFIDENCE = 0.5
+PERSON_DNN_TARGET = os.getenv('PERSON_DNN_TARGET', 'cpu')  # 'cpu', 'opencl', 'opencl_fp16', 'cuda', 'cuda_fp16'
+
+# Object Detection Configuration (YOLO, webcam_recognition.py)
+OBJECT_DNN_TARGET = os.getenv('OBJECT_DNN_TARGET', 'cpu')  # Same choices as PERSON_DNN_TARGET
 
 # Legacy face detection configs (kept for backward compatibility)
 FACE_SCALE_FACTOR = PERSON_SCALE_FACTOR
@@ -35,6 +64,7 @@ FACE_MIN_SIZE = PERSON_MIN_SIZE
 CONTROL_URL = os.getenv('CONTROL_URL', 'http://YOUR_URL')
 HTTP_TIMEOUT = 2  # Seconds to wait for HTTP response
 GESTURE_DEBOUNCE = 0.25  # Seconds between ANY command (250ms debounce)
+GESTURE_RESEND_INTERVAL = 2.0  # Seconds before repeating an unchanged command (None = never)
 
 # Gesture to Command Mapping (sent as JSON in body)
 # Only two commands: "follow" (open hand) and "stop" (fist)
@@ -3,13 +3,16 @@ Gesture Control Module
 
 Sends HTTP POST commands with JSON body to a target device based on recognized hand gestures.
 Maps gestures to command strings sent in JSON format.
-Uses threading for non-blocking requests.
+Uses one background worker and a keep-alive session for non-blocking requests.
 """
+import json
+import queue
 import requests
 import time
 import threading
 from typing import Optional
 from src import config
+from src.camera.capture_thread import put_latest
 
 
 class GestureController:
@@ -17,10 +20,13 @@ class GestureController:
     Controls external devices via HTTP POST based on hand gestures.
 
     This class maps hand gestures to commands and sends them as JSON
-    with debounce to prevent rapid repeated commands.
+    with debounce to prevent rapid repeated commands. A command is only
+    sent when the gesture changes, plus a periodic re-send of the current
+    one in case a request was lost.
     """
 
-    def __init__(self, url: Optional[str] = None, async_mode: bool = True):
+    def __init__(self, url: Optional[str] = None, async_mode: bool = True,
+                 force_resend_interval: Optional[float] = None):
         """
         Initialize the gesture controller.
 
@@ -28,15 +34,44 @@ class GestureController:
             url: Full URL of the target device (e.g., "http://YOUR_URL")
                  If None, uses config.CONTROL_URL
             async_mode: If True, sends requests in background thread (non-blocking)
+            force_resend_interval: Seconds before an unchanged gesture is sent again
+                                   If None, uses config.GESTURE_RESEND_INTERVAL
         """
         self.url = url or config.CONTROL_URL
         self.last_command_time = 0.0  # Global debounce timer
         self.debounce = config.GESTURE_DEBOUNCE  # Seconds between ANY commands
         self.async_mode = async_mode
+        self.last_gesture = None  # Gesture of the last command sent
+        if force_resend_interval is None:
+            force_resend_interval = config.GESTURE_RESEND_INTERVAL
+        self.force_resend_interval = force_resend_interval
+
+        # JSON bodies are built once here instead of being encoded on every send
+        self.payloads = {
+            gesture: json.dumps({'command': command}).encode('utf-8')
+            for gesture, command in config.GESTURE_COMMANDS.items()
+        }
+        self.headers = {'Content-Type': 'application/json'}
+
+        # One keep-alive connection reused for every command (no TCP handshake per send)
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Commands waiting for the worker. Only the newest one is kept:
+        # for "follow"/"stop" an outdated command is worse than none.
+        self.commands = queue.Queue(maxsize=1)
+        self.worker = None
+        if async_mode:
+            self.worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self.worker.start()
 
         print(f"GestureController initialized")
         print(f"  URL: {self.url}")
         print(f"  Debounce: {self.debounce * 1000}ms")
+        if self.force_resend_interval:
+            print(f"  Re-send unchanged: every {self.force_resend_interval}s")
         print(f"  Mode: {'Async (non-blocking)' if async_mode else 'Sync (blocking)'}")
 
     def send_gesture_command(self, gesture: str, handedness: Optional[str] = None) -> bool:
@@ -63,38 +98,37 @@ class GestureController:
         if time_since_last < self.debounce:
             return False  # Still in debounce period
 
-        # Get command string for this gesture
-        command = config.GESTURE_COMMANDS[gesture]
+        # Skip a gesture that is still being held, unless it is time to re-send it
+        if gesture == self.last_gesture and (
+                not self.force_resend_interval
+                or time_since_last < self.force_resend_interval):
+            return False
 
-        # Create simple JSON payload (only command field)
-        payload = {
-            'command': command
-        }
+        # Get command string and its prebuilt JSON body for this gesture
+        command = config.GESTURE_COMMANDS[gesture]
+        payload = self.payloads[gesture]
 
-        # Update debounce timer immediately
+        # Update debounce timer and gesture state immediately
         self.last_command_time = current_time
+        self.last_gesture = gesture
 
         if self.async_mode:
-            # Send request in background thread (non-blocking)
-            thread = threading.Thread(
-                target=self._send_request_async,
-                args=(payload, command),
-                daemon=True
-            )
-            thread.start()
+            # Hand the request to the background worker (non-blocking),
+            # replacing any command it hasn't sent yet
+            put_latest(self.commands, (payload, command))
             return True
         else:
             # Send request synchronously (blocking)
             return self._send_request_sync(payload, command)
 
-    def _send_request_sync(self, payload: dict, command: str) -> bool:
+    def _send_request_sync(self, payload: bytes, command: str) -> bool:
         """Send HTTP request synchronously (blocks until response)."""
         try:
             start_time = time.time()
-            response = requests.post(
+            response = self.session.post(
                 self.url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
+                data=payload,
+                headers=self.headers,
                 timeout=config.HTTP_TIMEOUT
             )
             elapsed_ms = (time.time() - start_time) * 1000
@@ -116,14 +150,22 @@ class GestureController:
             print(f"✗ Error: {e}")
             return False
 
-    def _send_request_async(self, payload: dict, command: str):
+    def _worker_loop(self):
+        """Send queued commands one at a time until close() is called."""
+        while True:
+            item = self.commands.get()
+            if item is None:
+                break
+            self._send_request_async(*item)
+
+    def _send_request_async(self, payload: bytes, command: str):
         """Send HTTP request asynchronously in background thread."""
         try:
             start_time = time.time()
-            response = requests.post(
+            response = self.session.post(
                 self.url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
+                data=payload,
+                headers=self.headers,
                 timeout=config.HTTP_TIMEOUT
             )
             elapsed_ms = (time.time() - start_time) * 1000
@@ -155,7 +197,7 @@ class GestureController:
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.url,
                 json=payload,
                 headers={'Content-Type': 'application/json'},
@@ -182,7 +224,7 @@ class GestureController:
         """
         try:
             payload = {'command': 'test'}
-            response = requests.post(
+            response = self.session.post(
                 self.url,
                 json=payload,
                 headers={'Content-Type': 'application/json'},
@@ -193,3 +235,11 @@ class GestureController:
         except Exception as e:
             print(f"✗ Connection failed to {self.url}: {e}")
             return False
+
+    def close(self):
+        """Stop the background worker and close the keep-alive connection."""
+        if self.worker is not None:
+            put_latest(self.commands, None)
+            self.worker.join(timeout=config.HTTP_TIMEOUT)
+            self.worker = None
+        self.session.close()
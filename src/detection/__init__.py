@@ -1,9 +1,15 @@
 """
 Detection package for hand detection, face detection, and gesture recognition.
-Provides gesture recognition, MediaPipe hand detection, and Haar Cascade face detection.
+Provides gesture recognition, MediaPipe hand detection, and Haar Cascade / DNN person detection.
 """
-from .gesture_recognition import count_fingers, recognize_gesture
+from .gesture_recognition import count_fingers, recognize_gesture, landmarks_to_array
 from .hand_detector import HandDetector
+from .live_hand_detector import LiveStreamHandDetector, create_hand_detector
 from .face_detector import FaceDetector
+from .dnn_person_detector import DnnPersonDetector, create_person_detector, set_dnn_target
+from .box_tracker import BoxTracker
 
-__all__ = ['count_fingers', 'recognize_gesture', 'HandDetector', 'FaceDetector']
+__all__ = ['count_fingers', 'recognize_gesture', 'landmarks_to_array',
+           'HandDetector', 'LiveStreamHandDetector', 'create_hand_detector',
+           'FaceDetector', 'DnnPersonDetector', 'create_person_detector', 'set_dnn_target',
+           'BoxTracker']
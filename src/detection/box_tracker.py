@@ -0,0 +1,79 @@
+"""
+Box Tracker Module.
+Follows previously detected bounding boxes between detector runs using
+OpenCV's lightweight KCF tracker.
+"""
+import cv2
+
+
+def _create_tracker():
+    """
+    Create a single-object tracker, using whichever API this OpenCV build has.
+
+    Returns:
+        cv2.Tracker: A new KCF tracker (MIL if KCF is unavailable)
+    """
+    if hasattr(cv2, 'TrackerKCF_create'):
+        return cv2.TrackerKCF_create()
+    if hasattr(cv2, 'legacy') and hasattr(cv2.legacy, 'TrackerKCF_create'):
+        return cv2.legacy.TrackerKCF_create()
+    return cv2.TrackerMIL_create()
+
+
+class BoxTracker:
+    """
+    Tracks a list of (x, y, w, h) boxes from frame to frame.
+
+    Running a tracker is much cheaper than a full Haar detection, so the
+    detector only needs to run every few frames; in between, the boxes are
+    moved along with the tracked objects.
+    """
+
+    def __init__(self):
+        """Initialize an empty tracker."""
+        self.trackers = []  # (tracker, box) pairs, tracker None for empty boxes
+
+    def init(self, frame, boxes):
+        """
+        Start tracking a new set of boxes, replacing the previous ones.
+
+        Empty boxes (zero width or height, e.g. clipped at the frame edge)
+        can't be tracked. They are skipped and stay where they are, so the
+        boxes from update() still line up with the detector's boxes.
+
+        Args:
+            frame: BGR image frame the boxes were detected in
+            boxes: List of (x, y, w, h) boxes from a detector
+        """
+        self.trackers = []
+        for (x, y, w, h) in boxes:
+            box = (int(x), int(y), int(w), int(h))
+            tracker = None
+            if w > 0 and h > 0:
+                tracker = _create_tracker()
+                tracker.init(frame, box)
+            self.trackers.append((tracker, box))
+
+    def update(self, frame):
+        """
+        Move the tracked boxes to their position in a new frame.
+
+        Args:
+            frame: Next BGR image frame
+
+        Returns:
+            tuple: (ok, boxes) - ok is False if any box was lost, meaning the
+                   detector should run again. boxes is a list of (x, y, w, h)
+        """
+        boxes = []
+        for tracker, box in self.trackers:
+            if tracker is None:
+                boxes.append(box)
+                continue
+
+            ok, (x, y, w, h) = tracker.update(frame)
+            if not ok:
+                return False, boxes
+            boxes.append((int(x), int(y), int(w), int(h)))
+
+        return True, boxes
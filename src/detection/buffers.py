@@ -0,0 +1,22 @@
+"""
+Buffers Module.
+Helpers for the per-frame scratch buffers the detectors reuse instead of
+allocating new arrays on every frame.
+"""
+import numpy as np
+
+
+def reuse_buffer(buffer, shape):
+    """
+    Return the buffer if it already has the given shape, else a new one.
+
+    Args:
+        buffer (numpy.ndarray): Previously allocated uint8 buffer, or None
+        shape (tuple): Required shape
+
+    Returns:
+        numpy.ndarray: uint8 buffer with the given shape
+    """
+    if buffer is None or buffer.shape != shape:
+        buffer = np.empty(shape, dtype=np.uint8)
+    return buffer
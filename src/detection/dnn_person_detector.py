@@ -0,0 +1,146 @@
+"""
+DNN Person Detection Module
+
+Provides a person detector based on a MobileNet-SSD network run through OpenCV's
+DNN module. A single forward pass replaces the multi-scale Haar sweep, is more
+reliable for full bodies, and can run on CUDA or OpenCL devices.
+"""
+import os
+import cv2
+from src import config
+from .face_detector import FaceDetector
+
+# Class ID of "person" in the VOC labels MobileNet-SSD was trained on
+PERSON_CLASS_ID = 15
+
+# Backend/target pairs selectable through config
+DNN_TARGETS = {
+    'cpu': (cv2.dnn.DNN_BACKEND_OPENCV, cv2.dnn.DNN_TARGET_CPU),
+    'opencl': (cv2.dnn.DNN_BACKEND_OPENCV, cv2.dnn.DNN_TARGET_OPENCL),
+    'opencl_fp16': (cv2.dnn.DNN_BACKEND_OPENCV, cv2.dnn.DNN_TARGET_OPENCL_FP16),
+    'cuda': (cv2.dnn.DNN_BACKEND_CUDA, cv2.dnn.DNN_TARGET_CUDA),
+    'cuda_fp16': (cv2.dnn.DNN_BACKEND_CUDA, cv2.dnn.DNN_TARGET_CUDA_FP16),
+}
+
+
+def set_dnn_target(net, target):
+    """
+    Select where an OpenCV DNN network runs, falling back to the CPU.
+
+    Args:
+        net (cv2.dnn.Net): Loaded network
+        target (str): One of the keys of DNN_TARGETS
+
+    Returns:
+        str: The target actually in use
+    """
+    if target not in DNN_TARGETS:
+        print(f"⚠️  DNN target '{target}' unknown (expected one of {', '.join(DNN_TARGETS)}), using CPU")
+        target = 'cpu'
+    elif target.startswith('cuda') and cv2.cuda.getCudaEnabledDeviceCount() == 0:
+        print(f"⚠️  DNN target '{target}' unavailable (no CUDA device), using CPU")
+        target = 'cpu'
+    elif target.startswith('opencl') and not cv2.ocl.haveOpenCL():
+        print(f"⚠️  DNN target '{target}' unavailable (no OpenCL device), using CPU")
+        target = 'cpu'
+
+    backend, device = DNN_TARGETS[target]
+    net.setPreferableBackend(backend)
+    net.setPreferableTarget(device)
+    return target
+
+
+class DnnPersonDetector:
+    """
+    Person detector using a MobileNet-SSD Caffe model.
+
+    Same interface as FaceDetector (process / draw_detections / close), so it
+    can be used as a drop-in replacement.
+    """
+
+    def __init__(self, prototxt=None, model=None, confidence=None, target=None):
+        """
+        Initialize the person detector by loading the network.
+
+        Args:
+            prototxt (str): Path to the network definition. If None, uses config
+            model (str): Path to the trained weights. If None, uses config
+            confidence (float): Minimum detection confidence (0.0-1.0)
+            target (str): Where to run the network ('cpu', 'opencl', 'cuda', ...)
+        """
+        prototxt = prototxt or config.PERSON_DNN_PROTOTXT
+        model = model or config.PERSON_DNN_MODEL
+        if confidence is None:
+            confidence = config.PERSON_DNN_CONFIDENCE
+
+        for path in (prototxt, model):
+            if not os.path.exists(path):
+                raise RuntimeError(f"DNN person model file not found: {path}")
+
+        self.net = cv2.dnn.readNetFromCaffe(prototxt, model)
+        self.target = set_dnn_target(self.net, target or config.PERSON_DNN_TARGET)
+        self.confidence = confidence
+
+    def process(self, frame):
+        """
+        Detect people in the given frame.
+
+        Args:
+            frame: BGR or grayscale image frame from OpenCV (numpy array)
+
+        Returns:
+            numpy.ndarray: (N, 4) array of (x, y, w, h) person rectangles
+        """
+        h, w = frame.shape[:2]
+
+        # The network was trained on color images
+        if frame.ndim == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+
+        # MobileNet-SSD expects 300x300 input, scaled to [-1, 1]
+        blob = cv2.dnn.blobFromImage(frame, 0.007843, (300, 300), 127.5)
+        self.net.setInput(blob)
+
+        # Each detection row: [batch, class_id, confidence, x1, y1, x2, y2]
+        detections = self.net.forward()[0, 0]
+        keep = ((detections[:, 1] == PERSON_CLASS_ID)
+                & (detections[:, 2] > self.confidence))
+
+        # Convert normalized corners to pixel (x, y, w, h) rectangles
+        corners = (detections[keep, 3:7] * (w, h, w, h)).clip(0, (w, h, w, h))
+        boxes = corners.astype(int)
+        boxes[:, 2:] -= boxes[:, :2]
+
+        return boxes
+
+    def draw_detections(self, frame, faces):
+        """
+        Draw simple rectangles around detected people.
+
+        Args:
+            frame: BGR image frame to draw on (numpy array)
+            faces: List of tuples (x, y, w, h) from process()
+
+        Returns:
+            Frame with person rectangles drawn (modifies in-place and returns)
+        """
+        for (x, y, w, h) in faces:
+            cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 0), 2)
+
+        return frame
+
+    def close(self):
+        """Clean up resources (provided for interface consistency)."""
+        pass
+
+
+def create_person_detector():
+    """
+    Create the person detector selected by config.PERSON_DETECTOR.
+
+    Returns:
+        FaceDetector or DnnPersonDetector: Haar ('haar') or DNN ('dnn') detector
+    """
+    if config.PERSON_DETECTOR == 'dnn':
+        return DnnPersonDetector()
+    return FaceDetector()
@@ -6,6 +6,35 @@ Detects full human bodies in video frames with minimal visual output.
 """
 import cv2
 from src import config
+from .buffers import reuse_buffer
+
+# Cascades already loaded, shared by all detector instances (parsing the XML is slow)
+_CASCADES = {}
+
+
+def _load_cascade(name):
+    """
+    Load a Haar Cascade bundled with OpenCV, reusing it if already loaded.
+
+    Note: a CascadeClassifier keeps per-image state while detecting, so the
+    shared instance must not be used from two threads at the same time.
+
+    Args:
+        name (str): Cascade file name (e.g. 'haarcascade_fullbody.xml')
+
+    Returns:
+        cv2.CascadeClassifier: The loaded classifier
+    """
+    if name not in _CASCADES:
+        cascade_path = cv2.data.haarcascades + name
+        cascade = cv2.CascadeClassifier(cascade_path)
+
+        if cascade.empty():
+            raise RuntimeError(f"Failed to load Haar Cascade from {cascade_path}")
+
+        _CASCADES[name] = cascade
+
+    return _CASCADES[name]
 
 
 class FaceDetector:
@@ -23,33 +52,68 @@ class FaceDetector:
         Initialize the person detector by loading the Haar Cascade classifier.
         """
         # Load the pre-trained Haar Cascade for full body detection
-        cascade_path = cv2.data.haarcascades + 'haarcascade_fullbody.xml'
-        self.face_cascade = cv2.CascadeClassifier(cascade_path)
+        self.face_cascade = _load_cascade('haarcascade_fullbody.xml')
 
-        if self.face_cascade.empty():
-            raise RuntimeError(f"Failed to load Haar Cascade from {cascade_path}")
+        # OpenCV's transparent API (UMat) runs the cascade through OpenCL
+        # on the GPU when the machine supports it
+        cv2.ocl.setUseOpenCL(config.USE_OPENCL)
+        self.use_opencl = config.USE_OPENCL and cv2.ocl.haveOpenCL()
+
+        # Gray and downscaled buffers, reused every frame instead of reallocated
+        self._gray = None
+        self._small = None
 
     def process(self, frame):
         """
         Detect people (full bodies) in the given frame.
 
         Args:
-            frame: BGR image frame from OpenCV (numpy array)
+            frame: BGR or grayscale image frame from OpenCV (numpy array)
 
         Returns:
             List of tuples (x, y, w, h) representing detected person rectangles
         """
-        # Convert to grayscale for Haar Cascade processing
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        # Convert to grayscale for Haar Cascade processing (unless it already is).
+        # Converting first means the resize below only has one channel to
+        # filter, which is much cheaper than shrinking the color frame for
+        # non-integer scale factors (e.g. 720p or 1080p down to 320 px wide).
+        if frame.ndim == 2:
+            gray = frame
+        else:
+            self._gray = reuse_buffer(self._gray, frame.shape[:2])
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        # Shrink the frame before detecting - Haar cost grows with pixel count,
+        # and a full body is still large enough to find at low resolution
+        scale = 1.0
+        height, width = gray.shape
+        if config.PERSON_DETECT_WIDTH and width > config.PERSON_DETECT_WIDTH:
+            scale = config.PERSON_DETECT_WIDTH / width
+            small_size = (config.PERSON_DETECT_WIDTH, round(height * scale))
+            self._small = reuse_buffer(self._small, small_size[::-1])
+            gray = cv2.resize(gray, small_size, dst=self._small,
+                              interpolation=cv2.INTER_AREA)
+
+        min_w, min_h = config.PERSON_MIN_SIZE
+        max_w, max_h = config.PERSON_MAX_SIZE or (0, 0)
+
+        # Upload to a UMat so detection runs on the GPU (results come back as NumPy)
+        if self.use_opencl:
+            gray = cv2.UMat(gray)
 
         # Detect people using configured parameters
         faces = self.face_cascade.detectMultiScale(
             gray,
             scaleFactor=config.PERSON_SCALE_FACTOR,
             minNeighbors=config.PERSON_MIN_NEIGHBORS,
-            minSize=config.PERSON_MIN_SIZE
+            minSize=(int(min_w * scale), int(min_h * scale)),
+            maxSize=(int(max_w * scale), int(max_h * scale))
         )
 
+        # Scale rectangles back to full-resolution coordinates
+        if scale != 1.0 and len(faces) > 0:
+            faces = (faces / scale).astype(int)
+
         return faces
 
     def draw_detections(self, frame, faces):
@@ -3,6 +3,92 @@ Gesture Recognition Module.
 Contains pure logic for finger counting and gesture recognition.
 Independent of MediaPipe or OpenCV - just processes landmark data.
 """
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional - without it the finger logic runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# Index, middle, ring and pinky tips, and their PIP joints
+FINGER_TIPS = np.array([8, 12, 16, 20])
+FINGER_PIPS = np.array([6, 10, 14, 18])
+
+# Gestures keyed by a 5-bit finger code: thumb, index, middle, ring, pinky
+# (thumb is the highest bit, pinky the lowest)
+GESTURES = {
+    0b00000: "Fist",
+    0b10000: "Thumbs Up",
+    0b01000: "Pointing",
+    0b01100: "Peace Sign",
+    0b11111: "Open Hand",
+    0b01001: "Rock On",
+}
+
+
+def landmarks_to_array(hand_landmarks):
+    """
+    Convert hand landmarks to a NumPy array of coordinates.
+
+    Reading each landmark attribute goes through MediaPipe's Python wrapper,
+    so we read all of them once and reuse the array afterwards. The values
+    are streamed straight into a preallocated array, without building a list
+    of tuples first.
+
+    Args:
+        hand_landmarks: MediaPipe hand landmarks object with 21 landmarks
+
+    Returns:
+        numpy.ndarray: (21, 2) float32 array of normalized (x, y) coordinates
+    """
+    return np.fromiter((v for lm in hand_landmarks.landmark for v in (lm.x, lm.y)),
+                       dtype=np.float32, count=42).reshape(21, 2)
+
+
+@njit(cache=True)
+def _finger_mask(pts, is_right):
+    """
+    Compute the 5-bit finger code from a landmark array.
+
+    Compiled to native code by Numba when it is installed.
+
+    Args:
+        pts (numpy.ndarray): (21, 2) array of normalized (x, y) coordinates
+        is_right (bool): True for a right hand
+
+    Returns:
+        int: Finger code - thumb is bit 4, index bit 3, ..., pinky bit 0
+    """
+    # Check thumb (different logic - horizontal movement)
+    # For right hand: thumb tip should be to the right of thumb IP
+    # For left hand: thumb tip should be to the left of thumb IP
+    if is_right:
+        thumb = pts[4, 0] < pts[3, 0]
+    else:  # Left hand
+        thumb = pts[4, 0] > pts[3, 0]
+    mask = 16 if thumb else 0
+
+    # Check other 4 fingers (vertical movement)
+    # Finger is up if tip is above PIP joint (smaller y value = higher on screen)
+    for i in range(4):
+        if pts[FINGER_TIPS[i], 1] < pts[FINGER_PIPS[i], 1]:
+            mask |= 8 >> i
+
+    return mask
+
+
+def warm_up():
+    """
+    Compile the finger logic ahead of time.
+
+    Numba compiles on the first call, so calling this at startup keeps the
+    first real frame from being slow.
+    """
+    _finger_mask(np.zeros((21, 2), dtype=np.float32), True)
 
 
 def count_fingers(hand_landmarks, handedness):
@@ -10,12 +96,13 @@ def count_fingers(hand_landmarks, handedness):
     Count how many fingers are extended.
 
     Args:
-        hand_landmarks: MediaPipe hand landmarks object with 21 landmarks
+        hand_landmarks: MediaPipe hand landmarks object with 21 landmarks,
+                        or the (21, 2) array from landmarks_to_array()
         handedness (str): "Right" or "Left" - which hand is detected
 
     Returns:
-        list: List of booleans [thumb, index, middle, ring, pinky]
-              True means finger is extended, False means folded
+        int: 5-bit finger code - thumb is bit 4, index bit 3, ..., pinky bit 0.
+             A set bit means the finger is extended.
 
     Landmark IDs reference:
     - Thumb: tip=4, IP=3
@@ -24,34 +111,24 @@ def count_fingers(hand_landmarks, handedness):
     - Ring: tip=16, PIP=14
     - Pinky: tip=20, PIP=18
     """
-    fingers = []
+    if isinstance(hand_landmarks, np.ndarray):
+        pts = hand_landmarks
+    else:
+        pts = landmarks_to_array(hand_landmarks)
 
-    # Check thumb (different logic - horizontal movement)
-    # For right hand: thumb tip should be to the right of thumb IP
-    # For left hand: thumb tip should be to the left of thumb IP
-    if handedness == "Right":
-        fingers.append(hand_landmarks.landmark[4].x < hand_landmarks.landmark[3].x)
-    else:  # Left hand
-        fingers.append(hand_landmarks.landmark[4].x > hand_landmarks.landmark[3].x)
-
-    # Check other 4 fingers (vertical movement)
-    # Finger is up if tip is above PIP joint (smaller y value = higher on screen)
-    finger_tips = [8, 12, 16, 20]  # Index, Middle, Ring, Pinky tips
-    finger_pips = [6, 10, 14, 18]  # Their PIP joints
-
-    for tip, pip in zip(finger_tips, finger_pips):
-        fingers.append(hand_landmarks.landmark[tip].y < hand_landmarks.landmark[pip].y)
-
-    return fingers
+    return int(_finger_mask(pts, handedness == "Right"))
 
 
 def recognize_gesture(fingers):
     """
     Recognize gesture based on which fingers are extended.
 
+    The finger code indexes the GESTURES table directly, so there is
+    no per-gesture comparison.
+
     Args:
-        fingers (list): [thumb, index, middle, ring, pinky]
-                       True if finger is up, False if down
+        fingers (int): Finger code from count_fingers() - thumb is bit 4,
+                       index bit 3, ..., pinky bit 0 (set = finger up)
 
     Returns:
         str: Name of the recognized gesture
@@ -65,32 +142,9 @@ def recognize_gesture(fingers):
     - Rock On: Index and pinky up
     - Default: Shows number of fingers up
     """
-    # Count total fingers up
-    total_fingers = sum(fingers)
-
-    # Fist - no fingers up
-    if total_fingers == 0:
-        return "Fist"
-
-    # Thumbs up - only thumb is up
-    if fingers == [True, False, False, False, False]:
-        return "Thumbs Up"
-
-    # Pointing - only index finger up
-    if fingers == [False, True, False, False, False]:
-        return "Pointing"
-
-    # Peace sign - index and middle fingers up
-    if fingers == [False, True, True, False, False]:
-        return "Peace Sign"
-
-    # Open hand - all fingers up
-    if total_fingers == 5:
-        return "Open Hand"
-
-    # Rock sign - index and pinky up
-    if fingers == [False, True, False, False, True]:
-        return "Rock On"
+    gesture = GESTURES.get(fingers)
+    if gesture is not None:
+        return gesture
 
     # Default - show number of fingers
-    return f"{total_fingers} Fingers"
+    return f"{bin(fingers).count('1')} Fingers"
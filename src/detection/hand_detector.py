@@ -2,8 +2,20 @@
 Hand Detector Module.
 Wraps MediaPipe Hands for easier use and cleaner interface.
 """
+import cv2
 import mediapipe as mp
+import numpy as np
 from .. import config
+from .buffers import reuse_buffer
+from .gesture_recognition import warm_up
+
+# Landmark index pairs of the hand skeleton, as one array for vectorized drawing
+HAND_CONNECTIONS = np.array(sorted(mp.solutions.hands.HAND_CONNECTIONS), dtype=np.int32)
+
+# Same colors as MediaPipe's default drawing style
+CONNECTION_COLOR = (224, 224, 224)
+LANDMARK_COLOR = (0, 0, 255)
+LANDMARK_BORDER_COLOR = (224, 224, 224)
 
 
 class HandDetector:
@@ -15,7 +27,8 @@ class HandDetector:
     def __init__(self,
                  max_num_hands=None,
                  min_detection_confidence=None,
-                 min_tracking_confidence=None):
+                 min_tracking_confidence=None,
+                 model_complexity=None):
         """
         Initialize hand detector.
 
@@ -23,23 +36,40 @@ class HandDetector:
             max_num_hands (int): Maximum number of hands to detect
             min_detection_confidence (float): Minimum confidence for detection (0.0-1.0)
             min_tracking_confidence (float): Minimum confidence for tracking (0.0-1.0)
+            model_complexity (int): 0 = lite model (faster), 1 = full model
         """
         # Use config values if not provided
         if max_num_hands is None:
             max_num_hands = config.MAX_NUM_HANDS
+        if model_complexity is None:
+            model_complexity = config.HAND_MODEL_COMPLEXITY
         if min_detection_confidence is None:
             min_detection_confidence = config.MIN_DETECTION_CONFIDENCE
         if min_tracking_confidence is None:
             min_tracking_confidence = config.MIN_TRACKING_CONFIDENCE
 
-        # Initialize MediaPipe components
-        self.mp_hands = mp.solutions.hands
-        self.mp_drawing = mp.solutions.drawing_utils
-
         # Configure hand detection
-        self.hands = self.mp_hands.Hands(
+        self.hands = self._create_model(max_num_hands, model_complexity,
+                                        min_detection_confidence, min_tracking_confidence)
+
+        # Downscaled frame buffer, reused every frame instead of reallocated
+        self._small = None
+
+        # Compile the gesture logic now instead of on the first frame
+        warm_up()
+
+    def _create_model(self, max_num_hands, model_complexity,
+                      min_detection_confidence, min_tracking_confidence):
+        """
+        Create the MediaPipe model (see __init__ for the arguments).
+
+        Returns:
+            mp.solutions.hands.Hands: Hands solution in video mode
+        """
+        return mp.solutions.hands.Hands(
             static_image_mode=False,  # False = video mode (continuous detection)
             max_num_hands=max_num_hands,
+            model_complexity=model_complexity,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence
         )
@@ -48,27 +78,69 @@ class HandDetector:
         """
         Process a frame to detect hands.
 
+        Large frames are shrunk to config.HAND_DETECT_WIDTH first, which cuts
+        MediaPipe's work a lot. Landmarks are normalized to [0, 1], so they
+        still match the full-size frame.
+
         Args:
             frame_rgb (numpy.ndarray): Frame in RGB format
 
         Returns:
             results: MediaPipe results object with hand landmarks
         """
-        return self.hands.process(frame_rgb)
+        return self.hands.process(self._shrink(frame_rgb))
+
+    def _shrink(self, frame_rgb):
+        """
+        Shrink a frame to config.HAND_DETECT_WIDTH, keeping its aspect ratio.
+
+        Args:
+            frame_rgb (numpy.ndarray): Frame in RGB format
+
+        Returns:
+            numpy.ndarray: The shrunk frame (in a reused buffer), or the frame
+                           itself if it is small enough already
+        """
+        height, width = frame_rgb.shape[:2]
+        if config.HAND_DETECT_WIDTH and width > config.HAND_DETECT_WIDTH:
+            # Keep the aspect ratio so hands aren't distorted
+            small_size = (config.HAND_DETECT_WIDTH,
+                          round(height * config.HAND_DETECT_WIDTH / width))
+            self._small = reuse_buffer(self._small, (small_size[1], small_size[0], 3))
+            frame_rgb = cv2.resize(frame_rgb, small_size, dst=self._small,
+                                   interpolation=cv2.INTER_AREA)
+
+        return frame_rgb
 
-    def draw_landmarks(self, frame, hand_landmarks):
+    def draw_landmarks(self, frame, pts):
         """
         Draw hand landmarks and connections on frame.
 
+        Looks like MediaPipe's draw_landmarks, but draws all connections with
+        one cv2.polylines call and all landmarks with two more, instead of a
+        cv2.line or cv2.circle call per connection and landmark. Like
+        MediaPipe, it skips landmarks outside the frame and the connections
+        to them.
+
         Args:
             frame (numpy.ndarray): Frame to draw on (BGR format)
-            hand_landmarks: MediaPipe hand landmarks to draw
+            pts (numpy.ndarray): (21, 2) array of normalized landmark coordinates
         """
-        self.mp_drawing.draw_landmarks(
-            frame,
-            hand_landmarks,
-            self.mp_hands.HAND_CONNECTIONS
-        )
+        h, w = frame.shape[:2]
+        pixels = np.minimum(pts * (w, h), (w - 1, h - 1)).astype(np.int32)
+        in_frame = ((pts >= 0) & (pts <= 1)).all(axis=1)
+        if not in_frame.any():
+            return
+
+        # Connections between two landmarks in the frame, as (N, 2, 2) line segments
+        connections = HAND_CONNECTIONS[in_frame[HAND_CONNECTIONS].all(axis=1)]
+        if len(connections):
+            cv2.polylines(frame, pixels[connections], False, CONNECTION_COLOR, 2)
+
+        # Landmarks as zero-length segments, which thick lines draw as dots
+        dots = np.repeat(pixels[in_frame, None], 2, axis=1)
+        cv2.polylines(frame, dots, False, LANDMARK_BORDER_COLOR, 8)
+        cv2.polylines(frame, dots, False, LANDMARK_COLOR, 5)
 
     def close(self):
         """Release MediaPipe resources."""
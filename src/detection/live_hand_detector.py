@@ -0,0 +1,140 @@
+"""
+Live-Stream Hand Detection Module
+
+Provides a hand detector based on MediaPipe's Tasks HandLandmarker in
+live-stream mode. Frames are handed to MediaPipe without waiting for the
+result, so MediaPipe works on one frame while the caller handles the previous
+one, instead of the synchronous solutions API blocking on every frame.
+"""
+import os
+import time
+from collections import namedtuple
+import mediapipe as mp
+from mediapipe.framework.formats import classification_pb2, landmark_pb2
+from mediapipe.tasks.python import BaseOptions, vision
+from src import config
+from .hand_detector import HandDetector
+
+# Same fields as the results of mp.solutions.hands.Hands.process()
+HandResults = namedtuple('HandResults', ['multi_hand_landmarks', 'multi_handedness'])
+
+
+class LiveStreamHandDetector(HandDetector):
+    """
+    Hand detector using MediaPipe's HandLandmarker in live-stream mode.
+
+    Same interface as HandDetector. process() returns right away with the
+    newest results MediaPipe has delivered so far, which lag a frame or two
+    behind. MediaPipe drops frames itself when it falls behind.
+
+    Needs the hand_landmarker.task model bundle (config.HAND_LANDMARKER_MODEL).
+    """
+
+    def __init__(self, model_path=None, **kwargs):
+        """
+        Initialize the detector by loading the model bundle.
+
+        Args:
+            model_path (str): Path to hand_landmarker.task. If None, uses config
+            **kwargs: Detection settings, as for HandDetector (model_complexity
+                      is fixed by the model bundle and ignored)
+        """
+        self.model_path = model_path or config.HAND_LANDMARKER_MODEL
+        if not os.path.exists(self.model_path):
+            raise RuntimeError(f"Hand landmarker model file not found: {self.model_path}")
+
+        # Newest result from MediaPipe's thread, replaced as a whole
+        self._latest = None
+        self._timestamp_ms = -1
+
+        super().__init__(**kwargs)
+
+    def _create_model(self, max_num_hands, model_complexity,
+                      min_detection_confidence, min_tracking_confidence):
+        """
+        Create the HandLandmarker (see HandDetector.__init__ for the arguments).
+
+        Returns:
+            vision.HandLandmarker: Landmarker in live-stream mode
+        """
+        options = vision.HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=self.model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            result_callback=self._on_result
+        )
+        return vision.HandLandmarker.create_from_options(options)
+
+    def _on_result(self, result, image, timestamp_ms):
+        """Store a result delivered by MediaPipe (called on MediaPipe's thread)."""
+        self._latest = result
+
+    def process(self, frame_rgb):
+        """
+        Queue a frame for hand detection and get the newest results.
+
+        Args:
+            frame_rgb (numpy.ndarray): Frame in RGB format
+
+        Returns:
+            HandResults: Newest results, shaped like the solutions API results
+        """
+        # MediaPipe copies the frame, so the shrink buffer can be reused
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=self._shrink(frame_rgb))
+
+        # Timestamps must keep increasing, even for frames within the same ms
+        self._timestamp_ms = max(int(time.monotonic() * 1000), self._timestamp_ms + 1)
+        self.hands.detect_async(image, self._timestamp_ms)
+
+        return _to_hand_results(self._latest)
+
+
+def _to_hand_results(result):
+    """
+    Convert a HandLandmarkerResult to the shape of the solutions API results.
+
+    New landmark objects are built on every call, because callers may modify
+    them (e.g. mirror_landmarks) and the same result can be returned twice.
+
+    Args:
+        result: HandLandmarkerResult, or None if none has arrived yet
+
+    Returns:
+        HandResults: Landmarks and handedness (None when no hand was found)
+    """
+    if result is None or not result.hand_landmarks:
+        return HandResults(None, None)
+
+    multi_hand_landmarks = []
+    for hand in result.hand_landmarks:
+        landmarks = landmark_pb2.NormalizedLandmarkList()
+        landmarks.landmark.extend(
+            landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z) for lm in hand)
+        multi_hand_landmarks.append(landmarks)
+
+    multi_handedness = []
+    for categories in result.handedness:
+        handedness = classification_pb2.ClassificationList()
+        handedness.classification.add(label=categories[0].category_name,
+                                      score=categories[0].score)
+        multi_handedness.append(handedness)
+
+    return HandResults(multi_hand_landmarks, multi_handedness)
+
+
+def create_hand_detector(**kwargs):
+    """
+    Create the hand detector selected by config.HAND_DETECTOR.
+
+    Args:
+        **kwargs: Detection settings, as for HandDetector
+
+    Returns:
+        HandDetector or LiveStreamHandDetector: Solutions API ('solutions') or
+        live-stream HandLandmarker ('live_stream') detector
+    """
+    if config.HAND_DETECTOR == 'live_stream':
+        return LiveStreamHandDetector(**kwargs)
+    return HandDetector(**kwargs)
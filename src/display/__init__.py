@@ -0,0 +1,28 @@
+"""
+Display package for showing annotated frames.
+Provides a background display thread for OpenCV windows, a headless
+stand-in for running without a screen, and background screenshot saving.
+"""
+from .display_thread import DisplayThread
+from .headless_display import HeadlessDisplay
+from .frame_saver import save_frame_async, wait_for_saves
+from .. import config
+
+
+def create_display(window_name):
+    """
+    Create the display for the current mode and start it.
+
+    Args:
+        window_name (str): Title of the OpenCV window
+
+    Returns:
+        DisplayThread or HeadlessDisplay: HeadlessDisplay if config.HEADLESS
+    """
+    if config.HEADLESS:
+        return HeadlessDisplay().start()
+    return DisplayThread(window_name).start()
+
+
+__all__ = ['DisplayThread', 'HeadlessDisplay', 'create_display',
+           'save_frame_async', 'wait_for_saves']
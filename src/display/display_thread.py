@@ -0,0 +1,115 @@
+"""
+Display Thread Module.
+Shows annotated frames with cv2.imshow on a background thread so that painting
+the previous frame overlaps with detection on the current one.
+"""
+import queue
+import sys
+import threading
+import cv2
+from ..camera.capture_thread import put_latest
+
+
+class DisplayThread:
+    """
+    Background window painter for annotated frames.
+
+    The main loop hands frames over with show() and polls key presses with
+    poll_key(). If painting falls behind, only the newest frame is painted.
+    On macOS, HighGUI windows must be driven from the main thread, so there
+    the frames are painted synchronously inside show() instead.
+    """
+
+    def __init__(self, window_name, threaded=None):
+        """
+        Initialize the display thread (call start() to begin painting).
+
+        Args:
+            window_name (str): Title of the OpenCV window
+            threaded (bool): Paint on a background thread. If None, uses a
+                             thread everywhere except macOS
+        """
+        if threaded is None:
+            threaded = sys.platform != 'darwin'
+
+        self.window_name = window_name
+        self.threaded = threaded
+        self.frames = queue.Queue(maxsize=1)
+        self.keys = queue.Queue()
+        self.thread = threading.Thread(target=self._display_loop, daemon=True)
+
+    def start(self):
+        """
+        Start the background display thread.
+
+        Returns:
+            DisplayThread: self, so it can be chained after the constructor
+        """
+        if self.threaded:
+            self.thread.start()
+        return self
+
+    def show(self, frame):
+        """
+        Queue a frame to be painted.
+
+        Args:
+            frame (numpy.ndarray): BGR frame to display. Must not be modified
+                                   by the caller afterwards.
+        """
+        if self.threaded:
+            put_latest(self.frames, frame)
+        else:
+            self._paint(frame)
+
+    def poll_key(self):
+        """
+        Get the next key pressed in the window, if any.
+
+        Returns:
+            int: Key code masked with 0xFF (0xFF when no key was pressed),
+                 same as cv2.waitKey(1) & 0xFF
+        """
+        try:
+            return self.keys.get_nowait()
+        except queue.Empty:
+            return 0xFF
+
+    def _paint(self, frame):
+        """Show one frame and record any key pressed meanwhile."""
+        cv2.imshow(self.window_name, frame)
+        self._pump_events()
+
+    def _pump_events(self):
+        """Let HighGUI process window events and record key presses."""
+        key = cv2.waitKey(1) & 0xFF
+        if key != 0xFF:
+            self.keys.put(key)
+
+    def _display_loop(self):
+        """Paint frames until the stop sentinel arrives."""
+        shown = False
+        while True:
+            try:
+                frame = self.frames.get(timeout=0.03)
+            except queue.Empty:
+                # Keep the window responsive while waiting for frames
+                if shown:
+                    self._pump_events()
+                continue
+
+            if frame is None:
+                break
+
+            self._paint(frame)
+            shown = True
+
+        cv2.destroyAllWindows()
+
+    def stop(self):
+        """Stop painting and close the window."""
+        if self.threaded:
+            put_latest(self.frames, None)
+            self.thread.join(timeout=2)
+        else:
+            cv2.destroyAllWindows()
@@ -0,0 +1,34 @@
+"""
+Frame Saver Module.
+Writes screenshots to disk on a background thread, so JPEG encoding and
+disk I/O never pause the capture/detection loop.
+"""
+from concurrent.futures import ThreadPoolExecutor, wait
+import cv2
+
+# A single worker keeps saves in order and off the main loop. It lives for
+# the whole process, so saving works again after wait_for_saves().
+_SAVE_POOL = ThreadPoolExecutor(max_workers=1)
+
+# Most recently submitted save: saves run in order, so once it is done,
+# all of them are
+_last_save = None
+
+
+def save_frame_async(filename, frame):
+    """
+    Save a frame to disk in the background.
+
+    Args:
+        filename (str): Output image path (format chosen by extension)
+        frame (numpy.ndarray): Frame to save. It is copied, so the caller may
+                               keep drawing on it.
+    """
+    global _last_save
+    _last_save = _SAVE_POOL.submit(cv2.imwrite, filename, frame.copy())
+
+
+def wait_for_saves():
+    """Wait for all pending saves to finish (call before exiting)."""
+    if _last_save is not None:
+        wait([_last_save])
@@ -0,0 +1,72 @@
+"""
+Headless Display Module.
+Stand-in for DisplayThread when running without a screen (e.g. on a server
+processing the ESP32-CAM feed): frames are not shown, and key presses are
+read from the terminal instead of the OpenCV window.
+"""
+import queue
+import signal
+import sys
+import threading
+
+
+class HeadlessDisplay:
+    """
+    Display that skips cv2.imshow/cv2.waitKey entirely.
+
+    Same interface as DisplayThread (start / show / poll_key / stop).
+    Type a key followed by Enter in the terminal to send it, and Ctrl+C
+    behaves like pressing 'q'.
+    """
+
+    def __init__(self):
+        """Initialize the headless display (call start() to begin reading keys)."""
+        self.keys = queue.Queue()
+        self.previous_sigint = None
+        self.thread = threading.Thread(target=self._stdin_loop, daemon=True)
+
+    def start(self):
+        """
+        Start reading keys from the terminal.
+
+        Must be called from the main thread (signal handlers live there).
+
+        Returns:
+            HeadlessDisplay: self, so it can be chained after the constructor
+        """
+        self.previous_sigint = signal.signal(signal.SIGINT, self._on_sigint)
+        self.thread.start()
+        print("Headless mode: type a key and press Enter (or Ctrl+C to quit)")
+        return self
+
+    def show(self, frame):
+        """Ignore the frame - there is no window to paint."""
+        pass
+
+    def poll_key(self):
+        """
+        Get the next key typed in the terminal, if any.
+
+        Returns:
+            int: Key code (0xFF when no key was typed), same as cv2.waitKey(1) & 0xFF
+        """
+        try:
+            return self.keys.get_nowait()
+        except queue.Empty:
+            return 0xFF
+
+    def _stdin_loop(self):
+        """Turn each line typed in the terminal into a key press."""
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                self.keys.put(ord(line[0]))
+
+    def _on_sigint(self, signum, frame):
+        """Treat Ctrl+C as a request to quit."""
+        self.keys.put(ord('q'))
+
+    def stop(self):
+        """Restore the default Ctrl+C behaviour."""
+        if self.previous_sigint is not None:
+            signal.signal(signal.SIGINT, self.previous_sigint)
@@ -0,0 +1,11 @@
+"""
+Pipeline package for running detectors on a camera feed.
+Provides the shared capture/detect/display loop, an optional background
+detection thread, and the detector stages it runs.
+"""
+from .detection_pipeline import DetectionPipeline
+from .detection_thread import DetectionThread
+from .stages import Stage, HandStage, PersonStage, draw_gesture_info, mirror_landmarks
+
+__all__ = ['DetectionPipeline', 'DetectionThread', 'Stage', 'HandStage', 'PersonStage',
+           'draw_gesture_info', 'mirror_landmarks']
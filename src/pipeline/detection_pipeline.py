@@ -0,0 +1,308 @@
+"""
+Detection Pipeline Module.
+The shared read -> detect -> draw -> display loop used by all applications.
+Which detectors run is decided by the list of stages passed in.
+"""
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+import numpy as np
+from .. import config
+from ..camera import CaptureThread
+from ..display import create_display, save_frame_async, wait_for_saves
+from .detection_thread import DetectionThread
+from .stages import FONT, GREEN, RED
+
+
+class DetectionPipeline:
+    """
+    Runs a list of stages on every camera frame and shows the result.
+
+    Frames are read and painted on background threads (or not painted at all
+    when headless), and only the newest frame is ever processed. With more
+    than one stage, the stages' process() calls run in parallel on a thread
+    pool, so each frame costs roughly the slowest stage instead of the sum.
+
+    Each frame is converted to RGB at most once, for all stages that want
+    it. If the camera already delivers RGB (cap.rgb is True), the RGB frame
+    goes to those stages as is and only the frame drawn on is converted.
+    RGB stages always get the unmirrored frame and mirror their own results,
+    so the mirror effect costs no extra pass over the pixels.
+
+    With async detection, the stages run on their own thread and every
+    frame is shown with the newest results available, so the display keeps
+    the camera's frame rate while results update at the detection rate.
+
+    Built-in keys: 'q' quits, 's' saves the current frame, and 'r' toggles
+    video recording when recording is enabled.
+    """
+
+    def __init__(self, stages, cap, window_name, mirror=False, frame_shape=None,
+                 key_handlers=None, capture_prefix='capture', video_prefix='video',
+                 recording=False, show_fps=False, async_detection=None):
+        """
+        Initialize the pipeline (call run() to start it).
+
+        Args:
+            stages (list): Stage objects to run on every frame, drawn in order
+            cap: Opened camera (cv2.VideoCapture or ESP32CamStream). Frames are
+                 BGR unless the camera has an rgb attribute set to True
+            window_name (str): Title of the OpenCV window
+            mirror (bool): Flip frames horizontally (mirror effect)
+            frame_shape (tuple): Reshape raw frames to this shape (for raw
+                                 grayscale capture), or None to keep them as is
+            key_handlers (dict): Extra keys, mapping a character to a function
+                                 called with no arguments
+            capture_prefix (str): File name prefix for screenshots
+            video_prefix (str): File name prefix for recorded videos
+            recording (bool): Enable toggling video recording with 'r'
+            show_fps (bool): Show the frame rate next to the stage labels
+            async_detection (bool): Run the stages on a background thread,
+                                    decoupled from display. If None, uses
+                                    config.ASYNC_DETECTION
+        """
+        self.stages = stages
+        self.cap = cap
+        self.window_name = window_name
+        self.mirror = mirror
+        self.frame_shape = frame_shape
+        self.capture_prefix = capture_prefix
+        self.video_prefix = video_prefix
+        self.show_fps = show_fps
+        if async_detection is None:
+            async_detection = config.ASYNC_DETECTION
+        self.async_detection = async_detection
+
+        self.key_handlers = {ord('s'): self.save_frame}
+        if recording:
+            self.key_handlers[ord('r')] = self.toggle_recording
+        for key, handler in (key_handlers or {}).items():
+            self.key_handlers[ord(key)] = handler
+
+        self.rgb_source = getattr(cap, 'rgb', False)
+        self.wants_rgb = any(stage.wants_rgb for stage in stages)
+        for stage in stages:
+            if stage.wants_rgb:
+                stage.mirror = mirror
+        self.frame_rgb = None  # RGB buffer reused every frame
+
+        self.frame = None  # Last annotated frame
+        self.video_writer = None
+
+    def run(self):
+        """Process frames until 'q' is pressed or the camera stops."""
+        # Read frames and paint the window on background threads
+        # (no window at all when running headless)
+        cap = CaptureThread(self.cap).start()
+        display = create_display(self.window_name)
+
+        # One worker per stage so they run at the same time
+        pool = ThreadPoolExecutor(max_workers=len(self.stages)) if len(self.stages) > 1 else None
+
+        processes = [stage.process for stage in self.stages]
+
+        def detect(inputs):
+            """Run all stages on one frame's inputs and wait for all results."""
+            # Each stage is only used by one task at a time
+            if pool is None:
+                return [process(image) for process, image in zip(processes, inputs)]
+            futures = [pool.submit(process, image)
+                       for process, image in zip(processes, inputs)]
+            return [future.result() for future in futures]
+
+        # Detect on a background thread, one frame at a time
+        detector = DetectionThread(detect).start() if self.async_detection else None
+
+        frame_count = 0
+        fps = 0
+        start_time = time.perf_counter()
+
+        # Bind everything used per frame to locals once: local lookups are
+        # cheaper than attribute and global lookups inside the loop
+        read = cap.read
+        show = display.show
+        poll_key = display.poll_key
+        convert = self._convert
+        perf_counter = time.perf_counter
+        frame_shape = self.frame_shape
+        show_fps = self.show_fps
+        key_handlers = self.key_handlers
+        quit_key = ord('q')
+        stages = self.stages
+        stages_want_rgb = self.wants_rgb
+        draws = [stage.draw for stage in stages]
+        labels_of = [stage.label for stage in stages]
+        wants_rgb = [stage.wants_rgb for stage in stages]
+
+        while True:
+            success, frame = read()
+
+            if not success:
+                print("Failed to read from camera")
+                break
+
+            # Raw grayscale frames may arrive as one flat row of bytes
+            if frame_shape is not None:
+                frame = frame.reshape(frame_shape)
+
+            if detector is None:
+                # Get the BGR frame to draw on and the RGB frame for the stages
+                frame, frame_rgb = convert(frame, stages_want_rgb)
+                results = detect([frame_rgb if rgb else frame for rgb in wants_rgb])
+            else:
+                # Hand this frame to the detection thread if it is free (the
+                # RGB frame is only needed then) and draw the newest results
+                idle = detector.is_idle()
+                frame, frame_rgb = convert(frame, idle and stages_want_rgb)
+                if idle:
+                    # The frame is drawn on while it is detected, so BGR
+                    # stages get a copy
+                    detector.submit([frame_rgb if rgb else frame.copy() for rgb in wants_rgb])
+                results = detector.latest()
+
+            # Drawing, display and recording need a color frame
+            if frame.ndim == 2:
+                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+
+            # Nothing to draw until the first frame has been detected
+            if results is None:
+                results = []
+
+            for draw, annotations in zip(draws, results):
+                draw(frame, annotations)
+
+            # Calculate FPS
+            frame_count += 1
+            if frame_count % 30 == 0:
+                elapsed = perf_counter() - start_time
+                fps = frame_count / elapsed if elapsed > 0 else 0
+
+            # Display stage labels at the top
+            labels = [label(annotations) for label, annotations in zip(labels_of, results)]
+            if show_fps:
+                labels.append(f"FPS: {fps:.1f}")
+            info_text = " | ".join(label for label in labels if label)
+            if info_text:
+                cv2.putText(frame, info_text, (10, 30), FONT, 0.7, GREEN, 2)
+
+            # Show recording indicator
+            if self.video_writer is not None:
+                cv2.circle(frame, (frame.shape[1] - 30, 30), 10, RED, -1)
+                cv2.putText(frame, "REC", (frame.shape[1] - 70, 35), FONT, 0.5, RED, 2)
+
+            # Display the frame
+            self.frame = frame
+            show(frame)
+
+            # Write frame if recording
+            if self.video_writer is not None:
+                self.video_writer.write(frame)
+
+            # Handle keyboard input
+            key = poll_key()
+
+            if key == quit_key:
+                break
+            elif key in key_handlers:
+                key_handlers[key]()
+
+        # Clean up
+        if detector is not None:
+            detector.stop()
+        if pool is not None:
+            pool.shutdown()
+        if self.video_writer is not None:
+            self.video_writer.release()
+            self.video_writer = None
+        cap.release()
+        display.stop()
+        for stage in self.stages:
+            stage.close()
+        wait_for_saves()
+
+    def _convert(self, frame, want_rgb):
+        """
+        Apply the mirror effect and build the frames the stages need.
+
+        Args:
+            frame (numpy.ndarray): Camera frame (BGR, RGB or grayscale)
+            want_rgb (bool): Build the RGB frame for the stages
+
+        Returns:
+            tuple: (frame, frame_rgb) - BGR (or grayscale) frame to draw on, with
+                   the mirror effect applied, and the unmirrored RGB frame
+                   (None if not wanted, unless the camera delivers RGB anyway)
+        """
+        if self.rgb_source:
+            frame_rgb = frame
+            if self.mirror:
+                frame = mirror_and_swap_channels(frame_rgb)
+            else:
+                frame = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
+            return frame, frame_rgb
+
+        frame_rgb = None
+        if want_rgb and frame.ndim == 3:
+            # Reuse the same RGB buffer every frame instead of allocating a new one
+            # (with async detection, only once the previous one is detected)
+            if self.frame_rgb is None or self.frame_rgb.shape != frame.shape:
+                self.frame_rgb = np.empty_like(frame)
+
+            # Convert BGR (OpenCV format) to RGB (MediaPipe format)
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.frame_rgb)
+
+        # Apply mirror effect if configured
+        if self.mirror:
+            frame = cv2.flip(frame, 1)
+
+        return frame, frame_rgb
+
+    @staticmethod
+    def _timestamped_name(prefix, extension):
+        """Build a file name like capture_20240101_120000.jpg."""
+        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        return f"{prefix}_{timestamp}.{extension}"
+
+    def save_frame(self):
+        """Save the last annotated frame to disk (encoded and written in the background)."""
+        if self.frame is None:
+            return
+        filename = self._timestamped_name(self.capture_prefix, 'jpg')
+        save_frame_async(filename, self.frame)
+        print(f"Saved frame as {filename}")
+
+    def toggle_recording(self):
+        """Start or stop recording annotated frames to a video file."""
+        if self.video_writer is None:
+            if self.frame is None:
+                return
+            # Start recording
+            filename = self._timestamped_name(self.video_prefix, 'avi')
+            fourcc = cv2.VideoWriter_fourcc(*'XVID')
+            self.video_writer = cv2.VideoWriter(filename, fourcc, 20.0,
+                                                (self.frame.shape[1], self.frame.shape[0]))
+            print(f"Started recording to {filename}")
+        else:
+            # Stop recording
+            self.video_writer.release()
+            self.video_writer = None
+            print("Stopped recording")
+
+
+def mirror_and_swap_channels(frame):
+    """
+    Mirror a 3-channel frame horizontally and swap RGB <-> BGR in a single pass.
+
+    Reversing a row of interleaved R,G,B bytes reverses both the pixel order
+    and the channel order, so flipping the frame viewed as a one-channel
+    (height, width * 3) image gives the mirrored frame in the other channel order.
+
+    Args:
+        frame: Contiguous RGB (or BGR) frame
+
+    Returns:
+        numpy.ndarray: Mirrored BGR (or RGB) frame
+    """
+    h, w, _ = frame.shape
+    return cv2.flip(frame.reshape(h, w * 3), 1).reshape(h, w, 3)
@@ -0,0 +1,96 @@
+"""
+Detection Thread Module.
+Runs detection on a background thread so that the display keeps up with the
+camera no matter how long detection takes.
+"""
+import queue
+import threading
+from ..camera.capture_thread import put_latest
+
+
+class DetectionThread:
+    """
+    Background runner for the stages' detection, decoupled from display.
+
+    The main loop hands over a frame with submit() whenever the thread is
+    idle and draws the newest results from latest() on every frame. Only one
+    frame is ever in flight, so results are never overwritten by older ones
+    and frames that arrive while detection is busy cost nothing.
+    """
+
+    def __init__(self, detect):
+        """
+        Initialize the detection thread (call start() to begin detecting).
+
+        Args:
+            detect (callable): Function taking the stage inputs for one frame
+                               and returning the stage results
+        """
+        self.detect = detect
+        self.inputs = queue.Queue(maxsize=1)
+        self.idle = threading.Event()
+        self.idle.set()
+        self.results = None  # Newest results, replaced as a whole
+        self.error = None  # Exception raised by detect(), re-raised by latest()
+        self.thread = threading.Thread(target=self._detection_loop, daemon=True)
+
+    def start(self):
+        """
+        Start the background detection thread.
+
+        Returns:
+            DetectionThread: self, so it can be chained after the constructor
+        """
+        self.thread.start()
+        return self
+
+    def is_idle(self):
+        """
+        Check if the thread is ready for the next frame.
+
+        Returns:
+            bool: True if no frame is being detected
+        """
+        return self.idle.is_set()
+
+    def submit(self, inputs):
+        """
+        Start detecting a frame. Only call when is_idle() is True.
+
+        Args:
+            inputs (list): Stage inputs for the frame. Must not be modified
+                           by the caller until the thread is idle again.
+        """
+        self.idle.clear()
+        put_latest(self.inputs, inputs)
+
+    def latest(self):
+        """
+        Get the results of the newest detected frame.
+
+        Returns:
+            list: Stage results, or None if no frame has been detected yet
+        """
+        if self.error is not None:
+            raise self.error
+        return self.results
+
+    def _detection_loop(self):
+        """Detect frames until the stop sentinel arrives."""
+        while True:
+            inputs = self.inputs.get()
+            if inputs is None:
+                break
+
+            try:
+                self.results = self.detect(inputs)
+            except Exception as e:
+                self.error = e
+                break
+            finally:
+                self.idle.set()
+
+    def stop(self):
+        """Stop the thread once the frame being detected (if any) is done."""
+        put_latest(self.inputs, None)
+        self.thread.join()
@@ -0,0 +1,300 @@
+"""
+Pipeline Stages Module.
+Detector wrappers run by DetectionPipeline. Each stage detects something in a
+frame with process() and draws what it found with draw().
+"""
+import cv2
+import numpy as np
+from .. import config
+from ..detection import (create_hand_detector, BoxTracker, create_person_detector,
+                         count_fingers, recognize_gesture, landmarks_to_array)
+
+# Drawing constants, built once instead of on every frame
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+GREEN = (0, 255, 0)
+RED = (0, 0, 255)
+CYAN = (255, 255, 0)
+
+# Finger tips to label - landmark IDs: 4=Thumb, 8=Index, 12=Middle, 16=Ring, 20=Pinky
+FINGER_TIP_NAMES = ("Thumb", "Index", "Middle", "Ring", "Pinky")
+
+# Landmarks converted to pixels for drawing: the wrist (0) followed by the finger tips
+LABEL_LANDMARKS = np.array([0, 4, 8, 12, 16, 20])
+
+# Control status indicator: text, offset from the right edge, color
+CONTROL_LABELS = {
+    True: ("CONTROL: ON", 150, GREEN),
+    False: ("CONTROL: OFF", 160, RED),
+}
+
+# Handedness as seen in the mirrored image
+MIRRORED_HANDEDNESS = {"Left": "Right", "Right": "Left"}
+
+
+class Stage:
+    """
+    Base class for pipeline stages.
+
+    process() may run on a worker thread at the same time as other stages'
+    process(), so it must only read the frame. draw(), label() and close()
+    always run on the pipeline thread.
+    """
+
+    # Set to True for stages whose process() wants an RGB frame. The pipeline
+    # converts each frame once and shares it between all such stages.
+    # The RGB frame is never mirrored: when the pipeline mirrors, it sets
+    # mirror to True and the stage mirrors its results instead.
+    wants_rgb = False
+    mirror = False
+
+    def process(self, frame):
+        """
+        Detect objects in a frame.
+
+        Args:
+            frame (numpy.ndarray): BGR frame (or grayscale for raw gray capture,
+                                   or RGB if wants_rgb). Must not be modified.
+
+        Returns:
+            Annotations passed to draw() and label()
+        """
+        raise NotImplementedError
+
+    def draw(self, frame, annotations):
+        """
+        Draw the annotations from process() on the frame.
+
+        Args:
+            frame (numpy.ndarray): BGR frame to draw on
+            annotations: Value returned by process() for this frame
+        """
+        pass
+
+    def label(self, annotations):
+        """
+        Short status text for the top of the frame (e.g. "People: 2").
+
+        Returns:
+            str or None: Text to show, or None to show nothing
+        """
+        return None
+
+    def close(self):
+        """Release resources."""
+        pass
+
+
+class HandStage(Stage):
+    """
+    MediaPipe hand detection with gesture recognition.
+
+    Optionally sends HTTP commands for recognized gestures through a
+    GestureController; control starts disabled and is toggled with
+    toggle_control().
+
+    With mirror set, MediaPipe runs on the unmirrored frame and the landmarks
+    are mirrored afterwards, which is far cheaper than flipping every pixel.
+
+    While a hand is in view, MediaPipe only runs every few frames and the last
+    hands are reused in between. With no hand in view it runs every frame, so
+    a new hand is picked up right away.
+    """
+
+    wants_rgb = True  # MediaPipe expects RGB
+
+    def __init__(self, detector=None, controller=None, detect_every_n=None):
+        """
+        Initialize the hand stage.
+
+        Args:
+            detector (HandDetector): Hand detector. If None, uses
+                                     create_hand_detector()
+            controller (GestureController): Controller for gesture commands,
+                                            or None to disable gesture control
+            detect_every_n (int): Run MediaPipe every N frames while a hand is
+                                  found. If None, uses config.HAND_DETECT_EVERY_N
+        """
+        self.detector = detector or create_hand_detector()
+        self.controller = controller
+        self.control_enabled = False
+        self.detect_every_n = detect_every_n or config.HAND_DETECT_EVERY_N
+        self.frame_count = 0
+        self.last_hands = []
+
+    def process(self, frame_rgb):
+        """
+        Detect hands and recognize their gestures.
+
+        Args:
+            frame_rgb (numpy.ndarray): RGB frame
+
+        Returns:
+            list: (hand_landmarks, pts, handedness, gesture) for each hand
+        """
+        # Reuse the last hands on skipped frames, as long as there were any
+        skip = self.last_hands and self.frame_count % self.detect_every_n != 0
+        self.frame_count += 1
+        if skip:
+            return self.last_hands
+
+        results = self.detector.process(frame_rgb)
+
+        hands = []
+        if results.multi_hand_landmarks:
+            for hand_landmarks, hand_class in zip(results.multi_hand_landmarks,
+                                                  results.multi_handedness):
+                # Get handedness (Left or Right)
+                handedness = hand_class.classification[0].label
+
+                if self.mirror:
+                    # MediaPipe assumes a mirrored image when it labels the
+                    # hands, so on the unmirrored frame the label is swapped
+                    handedness = MIRRORED_HANDEDNESS[handedness]
+                    mirror_landmarks(hand_landmarks)
+
+                # Read landmark coordinates once, shared by gestures and drawing
+                pts = landmarks_to_array(hand_landmarks)
+
+                # Count fingers and recognize gesture
+                gesture = recognize_gesture(count_fingers(pts, handedness))
+
+                # Send HTTP command if control is enabled
+                if self.control_enabled:
+                    self.controller.send_gesture_command(gesture, handedness)
+
+                hands.append((hand_landmarks, pts, handedness, gesture))
+
+        self.last_hands = hands
+        return hands
+
+    def draw(self, frame, hands):
+        """Draw landmarks, gesture labels and the control status indicator."""
+        for hand_landmarks, pts, handedness, gesture in hands:
+            # Draw all 21 landmarks and connections
+            self.detector.draw_landmarks(frame, pts)
+
+            # Display gesture information
+            draw_gesture_info(frame, pts, gesture, handedness)
+
+        # Display control status indicator
+        if self.controller is not None:
+            text, offset, color = CONTROL_LABELS[self.control_enabled]
+            cv2.putText(frame, text, (frame.shape[1] - offset, 30), FONT, 0.7, color, 2)
+
+    def label(self, hands):
+        """Number of hands detected."""
+        return f"Hands: {len(hands)}"
+
+    def toggle_control(self):
+        """Enable or disable sending gesture commands."""
+        self.control_enabled = not self.control_enabled
+        status = "ENABLED" if self.control_enabled else "DISABLED"
+        print(f"\n{'='*50}")
+        print(f"Gesture Control: {status}")
+        print(f"{'='*50}\n")
+
+    def close(self):
+        """Release the hand detector and the gesture controller."""
+        self.detector.close()
+        if self.controller is not None:
+            self.controller.close()
+
+
+class PersonStage(Stage):
+    """
+    Full-body person detection (Haar or DNN).
+
+    The detector only runs every few frames; in between, people are followed
+    by a cheap tracker. If a tracked person is lost, it detects again right away.
+    """
+
+    def __init__(self, detector=None, detect_every_n=None):
+        """
+        Initialize the person stage.
+
+        Args:
+            detector: FaceDetector or DnnPersonDetector. If None, uses
+                      create_person_detector()
+            detect_every_n (int): Run the detector every N frames.
+                                  If None, uses config.PERSON_DETECT_EVERY_N
+        """
+        self.detector = detector or create_person_detector()
+        self.detect_every_n = detect_every_n or config.PERSON_DETECT_EVERY_N
+        self.tracker = BoxTracker()
+        self.frame_count = 0
+
+    def process(self, frame):
+        """
+        Detect or track people.
+
+        Args:
+            frame (numpy.ndarray): BGR or grayscale frame
+
+        Returns:
+            array-like: (x, y, w, h) box for each person
+        """
+        tracked = False
+        if self.frame_count % self.detect_every_n != 0:
+            tracked, people = self.tracker.update(frame)
+
+        if not tracked:
+            people = self.detector.process(frame)
+            self.tracker.init(frame, people)
+
+        self.frame_count += 1
+        return people
+
+    def draw(self, frame, people):
+        """Draw people as simple blue rectangles."""
+        self.detector.draw_detections(frame, people)
+
+    def label(self, people):
+        """Number of people detected."""
+        return f"People: {len(people)}"
+
+    def close(self):
+        """Release the person detector."""
+        self.detector.close()
+
+
+def mirror_landmarks(hand_landmarks):
+    """
+    Mirror hand landmarks horizontally, in place.
+
+    Args:
+        hand_landmarks: MediaPipe hand landmarks (normalized coordinates)
+    """
+    for landmark in hand_landmarks.landmark:
+        landmark.x = 1.0 - landmark.x
+
+
+def draw_gesture_info(frame, pts, gesture, handedness):
+    """
+    Draw gesture and hand information on the frame.
+
+    Args:
+        frame: OpenCV frame to draw on
+        pts: (21, 2) array of normalized landmark coordinates
+        gesture: Recognized gesture name
+        handedness: "Left" or "Right"
+    """
+    h, w, _ = frame.shape
+
+    # Convert the wrist and finger tips to pixels in one step
+    pixels = (pts[LABEL_LANDMARKS] * (w, h)).astype(np.int32).tolist()
+
+    # Position text near the wrist
+    wrist_x, wrist_y = pixels[0]
+
+    # Draw gesture name
+    cv2.putText(frame, f"Gesture: {gesture}", (wrist_x - 80, wrist_y - 60),
+                FONT, 1, GREEN, 2)
+
+    # Draw handedness
+    cv2.putText(frame, f"Hand: {handedness} Hand", (wrist_x - 50, wrist_y - 30),
+                FONT, 0.7, CYAN, 2)
+
+    # Draw labels for each finger tip
+    for (cx, cy), finger_name in zip(pixels[1:], FINGER_TIP_NAMES):
+        # Draw finger name
+        cv2.putText(frame, finger_name, (cx, cy - 10), FONT, 0.5, GREEN, 2)
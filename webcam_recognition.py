@@ -1,19 +1,97 @@
 """
 Webcam Video Recognition with Object Detection
 Uses YOLOv3 for real-time object detection through your webcam
+
+Frames are read and painted on background threads, so waiting for the camera
+and painting the window overlap with detection on the main thread.
 """
 
 import cv2
 import numpy as np
-import urllib.request
 import os
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from src import config
+from src.camera import CaptureThread, configure_webcam
+from src.detection import BoxTracker, set_dnn_target
+from src.display import create_display, save_frame_async, wait_for_saves
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    # ONNX Runtime is optional - without it the model runs on OpenCV's DNN module
+    ort = None
+
+# INT8-quantized ONNX export of yolov3-tiny, used instead of the darknet files
+# when it exists and ONNX Runtime is installed. Its outputs must have the same
+# (N, 85) rows as the darknet YOLO output layers.
+ONNX_MODEL = "yolov3-tiny_int8.onnx"
+
+# ONNX Runtime providers in order of preference; the GPU ones are only used
+# when the installed onnxruntime build has them (onnxruntime-gpu)
+ONNX_PROVIDERS = [
+    ("TensorrtExecutionProvider", {"trt_fp16_enable": True}),
+    ("CUDAExecutionProvider", {"device_id": 0}),
+    "CPUExecutionProvider",
+]
+
+def download_file(url, path):
+    """
+    Download a file, resuming an interrupted download if there is one.
+
+    Data goes to path + '.part' first, which is renamed to path only once
+    complete, so a half-downloaded file is never mistaken for a finished one.
+    A partial file that doesn't line up with the server's file is discarded
+    and downloaded again from the start.
+    """
+    part_path = path + ".part"
+    done = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    
+    # Ask for the raw bytes: with a compressed response, the size of the
+    # decoded partial file wouldn't match the byte offsets of the range
+    headers = {"Accept-Encoding": "identity"}
+    if done:
+        headers["Range"] = f"bytes={done}-"
+    
+    with requests.get(url, headers=headers, stream=True, timeout=30) as response:
+        # Content-Range is "bytes <start>-<end>/<total>" on 206, "bytes */<total>" on 416
+        content_range = response.headers.get("Content-Range", "")
+        
+        if response.status_code == 416:
+            # Nothing left to send: the partial file is complete only if it
+            # is as big as the server's file
+            if content_range != f"bytes */{done}":
+                os.remove(part_path)
+                return download_file(url, path)
+        else:
+            response.raise_for_status()
+            
+            # Append only if the server sent the missing part from where the
+            # partial file ends; a full response (200) replaces it
+            mode = "wb"
+            if done and response.status_code == 206:
+                if not content_range.startswith(f"bytes {done}-"):
+                    os.remove(part_path)
+                    return download_file(url, path)
+                mode = "ab"
+            
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+    
+    os.replace(part_path, path)
 
 class WebcamRecognition:
     def __init__(self):
         self.net = None
+        self.session = None  # ONNX Runtime session, when the ONNX model is used
+        self.input_name = None
+        self.providers_in_use = []
         self.classes = []
         self.output_layers = []
         self.colors = []
+        self._resized = None  # Frame resized to the network input, reused every frame
+        self._blob = None  # Network input tensor, reused every frame
         
     def download_yolo_files(self):
         """Download YOLO configuration, weights, and class names"""
@@ -24,18 +102,22 @@ class WebcamRecognition:
         weights_url = "https://pjreddie.com/media/files/yolov3-tiny.weights"
         names_url = "https://raw.githubusercontent.com/pjreddie/darknet/master/data/coco.names"
         
-        # Download files
-        if not os.path.exists("yolov3-tiny.cfg"):
-            print("Downloading config file...")
-            urllib.request.urlretrieve(cfg_url, "yolov3-tiny.cfg")
+        files = [
+            ("yolov3-tiny.cfg", cfg_url, "config file"),
+            ("yolov3-tiny.weights", weights_url, "weights file (this is ~33MB)"),
+            ("coco.names", names_url, "class names"),
+        ]
+        missing = []
+        for path, url, description in files:
+            if not os.path.exists(path):
+                print(f"Downloading {description}...")
+                missing.append((path, url))
         
-        if not os.path.exists("yolov3-tiny.weights"):
-            print("Downloading weights file (this is ~33MB)...")
-            urllib.request.urlretrieve(weights_url, "yolov3-tiny.weights")
-        
-        if not os.path.exists("coco.names"):
-            print("Downloading class names...")
-            urllib.request.urlretrieve(names_url, "coco.names")
+        # Download files at the same time, so the small ones don't wait
+        # behind the weights
+        with ThreadPoolExecutor(max_workers=len(files)) as pool:
+            for future in [pool.submit(download_file, url, path) for path, url in missing]:
+                future.result()
         
         print("Files downloaded successfully!")
     
@@ -47,15 +129,41 @@ class WebcamRecognition:
         with open("coco.names", "r") as f:
             self.classes = [line.strip() for line in f.readlines()]
         
-        # Generate random colors for each class
-        self.colors = np.random.uniform(0, 255, size=(len(self.classes), 3))
+        # Generate random colors for each class, as plain int tuples so
+        # OpenCV doesn't have to convert a float array on every draw call
+        self.colors = [tuple(color) for color in
+                       np.random.randint(0, 256, size=(len(self.classes), 3)).tolist()]
         
-        # Load YOLO
-        self.net = cv2.dnn.readNet("yolov3-tiny.weights", "yolov3-tiny.cfg")
+        # Input buffers, allocated once instead of on every frame
+        self._resized = np.empty((416, 416, 3), dtype=np.uint8)
+        self._blob = np.empty((1, 3, 416, 416), dtype=np.float32)
         
-        # Get output layer names
-        layer_names = self.net.getLayerNames()
-        self.output_layers = [layer_names[i - 1] for i in self.net.getUnconnectedOutLayers()]
+        if ort is not None and os.path.exists(ONNX_MODEL):
+            # INT8 model: usually faster on CPUs with INT8 (VNNI) instructions,
+            # and offloaded to an NVIDIA GPU when one is available
+            available = ort.get_available_providers()
+            providers = [provider for provider in ONNX_PROVIDERS
+                         if (provider[0] if isinstance(provider, tuple) else provider) in available]
+            
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            
+            self.session = ort.InferenceSession(ONNX_MODEL, options, providers=providers)
+            self.input_name = self.session.get_inputs()[0].name
+            self.providers_in_use = self.session.get_providers()
+            print(f"Using ONNX Runtime with {ONNX_MODEL} on {', '.join(self.providers_in_use)}")
+        else:
+            # Load YOLO
+            self.net = cv2.dnn.readNet("yolov3-tiny.weights", "yolov3-tiny.cfg")
+            
+            # Run on the GPU (CUDA or OpenCL, optionally FP16) when configured
+            # and available, on the CPU otherwise
+            target = set_dnn_target(self.net, config.OBJECT_DNN_TARGET)
+            print(f"DNN target: {target}")
+            
+            # Get output layer names
+            layer_names = self.net.getLayerNames()
+            self.output_layers = [layer_names[i - 1] for i in self.net.getUnconnectedOutLayers()]
         
         print("Model loaded successfully!")
     
@@ -64,64 +172,74 @@ class WebcamRecognition:
         height, width, channels = frame.shape
         
         # Prepare image for detection
-        blob = cv2.dnn.blobFromImage(frame, 0.00392, (416, 416), (0, 0, 0), True, crop=False)
-        self.net.setInput(blob)
+        # Same as cv2.dnn.blobFromImage(frame, 0.00392, (416, 416), (0, 0, 0), True),
+        # but written into the reused buffers: resize, swap BGR to RGB,
+        # reorder to channels-first and scale in one step
+        cv2.resize(frame, (416, 416), dst=self._resized)
+        blob = self._blob
+        np.multiply(self._resized[:, :, ::-1].transpose(2, 0, 1), np.float32(0.00392), out=blob[0])
         
         # Run detection
-        outs = self.net.forward(self.output_layers)
-        
-        # Process detections
-        class_ids = []
-        confidences = []
-        boxes = []
-        
-        for out in outs:
-            for detection in out:
-                scores = detection[5:]
-                class_id = np.argmax(scores)
-                confidence = scores[class_id]
-                
-                if confidence > 0.5:  # Confidence threshold
-                    # Object detected
-                    center_x = int(detection[0] * width)
-                    center_y = int(detection[1] * height)
-                    w = int(detection[2] * width)
-                    h = int(detection[3] * height)
-                    
-                    # Rectangle coordinates
-                    x = int(center_x - w / 2)
-                    y = int(center_y - h / 2)
-                    
-                    boxes.append([x, y, w, h])
-                    confidences.append(float(confidence))
-                    class_ids.append(class_id)
-        
-        # Apply non-maximum suppression to remove overlapping boxes
-        indexes = cv2.dnn.NMSBoxes(boxes, confidences, 0.5, 0.4)
-        
-        return boxes, confidences, class_ids, indexes
+        if self.session is not None:
+            # Outputs keep their batch dimension; it is flattened away below
+            outs = self.session.run(None, {self.input_name: blob})
+        else:
+            self.net.setInput(blob)
+            outs = self.net.forward(self.output_layers)
+        
+        # Process detections of all output layers at once: one row per box,
+        # with center x, center y, width, height, objectness, then class scores
+        detections = np.concatenate([out.reshape(-1, out.shape[-1]) for out in outs])
+        scores = detections[:, 5:]
+        class_ids = scores.argmax(axis=1)
+        confidences = scores[np.arange(len(scores)), class_ids]
+        
+        # Keep only confident boxes
+        keep = confidences > 0.5  # Confidence threshold
+        detections = detections[keep]
+        class_ids = class_ids[keep]
+        confidences = confidences[keep]
+        
+        # Scale to pixels (truncated like int()) and convert centers to corners
+        center_x = (detections[:, 0] * width).astype(np.int32)
+        center_y = (detections[:, 1] * height).astype(np.int32)
+        w = (detections[:, 2] * width).astype(np.int32)
+        h = (detections[:, 3] * height).astype(np.int32)
+        x = (center_x - w / 2).astype(np.int32)
+        y = (center_y - h / 2).astype(np.int32)
+        
+        boxes = np.stack([x, y, w, h], axis=1)
+        
+        # Apply non-maximum suppression to remove overlapping boxes of the
+        # same class, straight on the arrays
+        indexes = cv2.dnn.NMSBoxesBatched(boxes, confidences, class_ids.astype(np.int32), 0.5, 0.4)
+        
+        # Plain lists from here on, as drawing and tracking expect
+        return boxes.tolist(), confidences.tolist(), class_ids.tolist(), indexes
     
     def draw_labels(self, frame, boxes, confidences, class_ids, indexes):
         """Draw bounding boxes and labels on frame"""
         font = cv2.FONT_HERSHEY_SIMPLEX
         
-        for i in range(len(boxes)):
-            if i in indexes:
-                x, y, w, h = boxes[i]
-                label = str(self.classes[class_ids[i]])
-                confidence = confidences[i]
-                color = self.colors[class_ids[i]]
-                
-                # Draw bounding box
-                cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
-                
-                # Draw label background
-                label_text = f"{label} {confidence:.2f}"
-                (text_width, text_height), _ = cv2.getTextSize(label_text, font, 0.5, 2)
-                cv2.rectangle(frame, (x, y - 20), (x + text_width, y), color, -1)
-                
-                # Draw label text
-                cv2.putText(frame, label_text, (x, y - 5), font, 0.5, (0, 0, 0), 2)
+        # Only visit the boxes kept by non-maximum suppression
+        # (NMSBoxes returns an empty tuple when nothing is kept)
+        for i in np.asarray(indexes, dtype=int).ravel().tolist():
+            x, y, w, h = boxes[i]
+            class_id = class_ids[i]
+            label = str(self.classes[class_id])
+            confidence = confidences[i]
+            color = self.colors[class_id]
+            
+            # Draw bounding box
+            cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
+            
+            # Draw label background
+            label_text = f"{label} {confidence:.2f}"
+            (text_width, text_height), _ = cv2.getTextSize(label_text, font, 0.5, 2)
+            cv2.rectangle(frame, (x, y - 20), (x + text_width, y), color, -1)
+            
+            # Draw label text
+            cv2.putText(frame, label_text, (x, y - 5), font, 0.5, (0, 0, 0), 2)
         
         return frame
     
@@ -142,6 +260,17 @@ class WebcamRecognition:
             print("Error: Could not open webcam")
             return
         
+        # Compressed MJPG at a fixed rate, with a one-frame driver buffer
+        configure_webcam(cap)
+        
+        # Read frames and paint the window on background threads; the model
+        # stays on this thread. Only the newest frame is ever processed.
+        cap = CaptureThread(cap).start()
+        display = create_display('Webcam Object Recognition - Press Q to quit')
+        
+        # Follows the detected objects between YOLO runs
+        tracker = BoxTracker()
+        
         frame_count = 0
         
         while True:
@@ -151,33 +280,50 @@ class WebcamRecognition:
                 print("Error: Failed to capture frame")
                 break
             
-            # Process every 3rd frame for better performance
-            if frame_count % 3 == 0:
+            # Run YOLO every 3rd frame for better performance. In between, the
+            # last boxes are moved along by a cheap tracker instead of
+            # disappearing; if a box is lost, YOLO runs again right away.
+            tracked = False
+            if frame_count % 3 != 0:
+                tracked, tracked_boxes = tracker.update(frame)
+            
+            if tracked:
+                boxes = tracked_boxes
+            else:
                 boxes, confidences, class_ids, indexes = self.detect_objects(frame)
-                frame = self.draw_labels(frame, boxes, confidences, class_ids, indexes)
+                
+                # Only keep the boxes that survived NMS
+                kept = np.asarray(indexes, dtype=int).ravel().tolist()
+                boxes = [boxes[i] for i in kept]
+                confidences = [confidences[i] for i in kept]
+                class_ids = [class_ids[i] for i in kept]
+                tracker.init(frame, boxes)
+            
+            frame = self.draw_labels(frame, boxes, confidences, class_ids, range(len(boxes)))
             
             # Display FPS
             cv2.putText(frame, f"Frame: {frame_count}", (10, 30), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
             
             # Show frame
-            cv2.imshow('Webcam Object Recognition - Press Q to quit', frame)
+            display.show(frame)
             
             # Handle key presses
-            key = cv2.waitKey(1) & 0xFF
+            key = display.poll_key()
             
             if key == ord('q'):
                 break
             elif key == ord('s'):
                 filename = f"capture_{frame_count}.jpg"
-                cv2.imwrite(filename, frame)
+                save_frame_async(filename, frame)
                 print(f"Saved frame as {filename}")
             
             frame_count += 1
         
         # Cleanup
         cap.release()
-        cv2.destroyAllWindows()
+        display.stop()
+        wait_for_saves()
         print("\nWebcam closed. Goodbye!")
 
 if __name__ == "__main__":